@@ -10,6 +10,13 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 import os
 from collections import defaultdict
+from importlib.util import find_spec
+from pathlib import Path
+import sys
+
+# Shared analysis helpers live in scripts/core
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'core'))
+from prompt_labels import classify_prompts
 
 # Set up plotting style
 plt.style.use('default')
@@ -19,6 +26,9 @@ sns.set_palette("husl")
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 BASE_CHARTS_DIR = os.path.join(SCRIPT_DIR, '..', 'results', 'comparison', 'comprehensive_model_analysis')
 
+# PyArrow's multi-threaded CSV reader is used when available, else pandas' C parser
+CSV_ENGINE = 'pyarrow' if find_spec('pyarrow') is not None else 'c'
+
 class ComprehensiveModelAnalyzer:
     def __init__(self, model_configs):
         """
@@ -55,11 +65,11 @@ class ComprehensiveModelAnalyzer:
         for model_name, config in self.model_configs.items():
             try:
                 # Load cultural data
-                cultural_detailed_df = pd.read_csv(config['cultural_metrics_path'])
-                cultural_summary_df = pd.read_csv(config['cultural_summary_path'])
+                cultural_detailed_df = pd.read_csv(config['cultural_metrics_path'], engine=CSV_ENGINE)
+                cultural_summary_df = pd.read_csv(config['cultural_summary_path'], engine=CSV_ENGINE)
                 
                 # Load general data
-                general_summary_df = pd.read_csv(config['general_summary_path'])
+                general_summary_df = pd.read_csv(config['general_summary_path'], engine=CSV_ENGINE)
                 
                 # Clean and prepare cultural data
                 cultural_summary_df = cultural_summary_df.dropna(subset=['country', 'category', 'variant'])
@@ -69,9 +79,8 @@ class ComprehensiveModelAnalyzer:
                 cultural_summary_df['model'] = model_name
                 
                 # Clean and prepare general data
-                general_summary_df['country'] = general_summary_df['prompt'].apply(self._extract_country)
-                general_summary_df['category'] = general_summary_df['prompt'].apply(self._extract_category)
-                general_summary_df['variant'] = general_summary_df['prompt'].apply(self._extract_variant)
+                for field, labels in classify_prompts(general_summary_df['prompt']).items():
+                    general_summary_df[field] = labels
                 general_summary_df['model'] = model_name
                 
                 # Clean step information for general data
@@ -99,56 +108,6 @@ class ComprehensiveModelAnalyzer:
                                            ignore_index=True)
             print(f"📊 Combined dataset: Cultural={len(self.combined_cultural)}, General={len(self.combined_general)}")
     
-    def _extract_country(self, prompt):
-        """Extract country from prompt"""
-        prompt_lower = prompt.lower()
-        if 'china' in prompt_lower:
-            return 'China'
-        elif 'korea' in prompt_lower:
-            return 'Korea'
-        elif 'india' in prompt_lower:
-            return 'India'
-        elif 'kenya' in prompt_lower:
-            return 'Kenya'
-        elif 'nigeria' in prompt_lower:
-            return 'Nigeria'
-        elif 'united states' in prompt_lower or 'america' in prompt_lower:
-            return 'United_States'
-        return 'Unknown'
-    
-    def _extract_category(self, prompt):
-        """Extract category from prompt"""
-        prompt_lower = prompt.lower()
-        if any(word in prompt_lower for word in ['house', 'landmark', 'building']):
-            return 'architecture'
-        elif any(word in prompt_lower for word in ['dance', 'painting', 'music']):
-            return 'art'
-        elif any(word in prompt_lower for word in ['wedding', 'funeral', 'festival', 'game', 'sport']):
-            return 'event'
-        elif any(word in prompt_lower for word in ['clothing', 'accessories', 'makeup']):
-            return 'fashion'
-        elif any(word in prompt_lower for word in ['food', 'dessert', 'drink']):
-            return 'food'
-        elif any(word in prompt_lower for word in ['animal', 'wildlife']):
-            return 'wildlife'
-        elif any(word in prompt_lower for word in ['landscape', 'nature']):
-            return 'landscape'
-        return 'other'
-    
-    def _extract_variant(self, prompt):
-        """Extract variant from prompt"""
-        prompt_lower = prompt.lower()
-        if 'traditional' in prompt_lower:
-            return 'traditional'
-        elif 'modern' in prompt_lower:
-            return 'modern'
-        elif 'national' in prompt_lower:
-            return 'national'
-        elif 'common' in prompt_lower:
-            return 'common'
-        else:
-            return 'general'
-    
     def create_model_country_performance(self):
         """Create detailed model-country performance analysis"""
         print(f"\n🌍 Generating Model-Country Performance Analysis...")
@@ -267,37 +226,25 @@ class ComprehensiveModelAnalyzer:
         # Create ranking dataframe
         ranking_df = pd.DataFrame(model_scores).T
         
-        # Cultural Representative Score Ranking
-        cultural_rep_ranking = ranking_df.sort_values('Cultural Rep', ascending=False)
-        axes[0, 0].barh(cultural_rep_ranking.index, cultural_rep_ranking['Cultural Rep'], color='skyblue')
-        axes[0, 0].set_title('Cultural Representative Score Ranking', fontsize=14, fontweight='bold')
-        axes[0, 0].set_xlabel('Cultural Representative Score')
-        for i, v in enumerate(cultural_rep_ranking['Cultural Rep']):
-            axes[0, 0].text(v + 0.01, i, f'{v:.2f}', va='center')
-        
-        # F1 Score Ranking
-        f1_ranking = ranking_df.sort_values('F1 Score', ascending=False)
-        axes[0, 1].barh(f1_ranking.index, f1_ranking['F1 Score'], color='lightgreen')
-        axes[0, 1].set_title('F1 Score Ranking', fontsize=14, fontweight='bold')
-        axes[0, 1].set_xlabel('F1 Score')
-        for i, v in enumerate(f1_ranking['F1 Score']):
-            axes[0, 1].text(v + 0.001, i, f'{v:.3f}', va='center')
-        
-        # CLIP Score Ranking
-        clip_ranking = ranking_df.sort_values('CLIP Score', ascending=False)
-        axes[1, 0].barh(clip_ranking.index, clip_ranking['CLIP Score'], color='lightcoral')
-        axes[1, 0].set_title('CLIP Score Ranking', fontsize=14, fontweight='bold')
-        axes[1, 0].set_xlabel('CLIP Score')
-        for i, v in enumerate(clip_ranking['CLIP Score']):
-            axes[1, 0].text(v + 0.1, i, f'{v:.1f}', va='center')
-        
-        # Aesthetic Score Ranking
-        aesthetic_ranking = ranking_df.sort_values('Aesthetic Score', ascending=False)
-        axes[1, 1].barh(aesthetic_ranking.index, aesthetic_ranking['Aesthetic Score'], color='gold')
-        axes[1, 1].set_title('Aesthetic Score Ranking', fontsize=14, fontweight='bold')
-        axes[1, 1].set_xlabel('Aesthetic Score')
-        for i, v in enumerate(aesthetic_ranking['Aesthetic Score']):
-            axes[1, 1].text(v + 0.001, i, f'{v:.2f}', va='center')
+        # Sort every metric in one pass over the long-form rankings
+        ranking_panels = [
+            ('Cultural Rep', 'Cultural Representative Score', 'skyblue', '%.2f'),
+            ('F1 Score', 'F1 Score', 'lightgreen', '%.3f'),
+            ('CLIP Score', 'CLIP Score', 'lightcoral', '%.1f'),
+            ('Aesthetic Score', 'Aesthetic Score', 'gold', '%.2f')
+        ]
+        ranking_long = (ranking_df[[metric for metric, _, _, _ in ranking_panels]]
+                        .rename_axis('model').reset_index()
+                        .melt(id_vars='model', var_name='metric', value_name='score')
+                        .sort_values(['metric', 'score'], ascending=[True, False]))
+        rankings = dict(list(ranking_long.groupby('metric', sort=False)))
+        
+        for ax, (metric, label, color, fmt) in zip(axes.flat, ranking_panels):
+            ranking = rankings[metric]
+            bars = ax.barh(ranking['model'], ranking['score'], color=color)
+            ax.set_title(f'{label} Ranking', fontsize=14, fontweight='bold')
+            ax.set_xlabel(label)
+            ax.bar_label(bars, fmt=fmt, padding=3)
         
         plt.tight_layout()
         save_path = os.path.join(self.folders['scoring_comparison'], "model_performance_ranking.png")
@@ -625,40 +572,32 @@ class ComprehensiveModelAnalyzer:
 def main():
     """Main function to run comprehensive model analysis"""
     # Define model configurations
-    base_path = '/Users/chan/ECB/evaluation/output'
+    base_path = Path('/Users/chan/ECB/evaluation/output')
     
+    models = ('flux', 'hidream', 'nextstep', 'qwen', 'sd35')
+    model_dirs = {model: base_path / model for model in models}
+    model_files = {
+        'cultural_metrics_path': 'cultural_metrics.csv',
+        'cultural_summary_path': 'cultural_metrics_summary.csv',
+        'general_summary_path': 'general_metrics_summary.csv'
+    }
     model_configs = {
-        'flux': {
-            'cultural_metrics_path': os.path.join(base_path, 'flux', 'cultural_metrics.csv'),
-            'cultural_summary_path': os.path.join(base_path, 'flux', 'cultural_metrics_summary.csv'),
-            'general_summary_path': os.path.join(base_path, 'flux', 'general_metrics_summary.csv')
-        },
-        'hidream': {
-            'cultural_metrics_path': os.path.join(base_path, 'hidream', 'cultural_metrics.csv'),
-            'cultural_summary_path': os.path.join(base_path, 'hidream', 'cultural_metrics_summary.csv'),
-            'general_summary_path': os.path.join(base_path, 'hidream', 'general_metrics_summary.csv')
-        },
-        'nextstep': {
-            'cultural_metrics_path': os.path.join(base_path, 'nextstep', 'cultural_metrics.csv'),
-            'cultural_summary_path': os.path.join(base_path, 'nextstep', 'cultural_metrics_summary.csv'),
-            'general_summary_path': os.path.join(base_path, 'nextstep', 'general_metrics_summary.csv')
-        },
-        'qwen': {
-            'cultural_metrics_path': os.path.join(base_path, 'qwen', 'cultural_metrics.csv'),
-            'cultural_summary_path': os.path.join(base_path, 'qwen', 'cultural_metrics_summary.csv'),
-            'general_summary_path': os.path.join(base_path, 'qwen', 'general_metrics_summary.csv')
-        },
-        'sd35': {
-            'cultural_metrics_path': os.path.join(base_path, 'sd35', 'cultural_metrics.csv'),
-            'cultural_summary_path': os.path.join(base_path, 'sd35', 'cultural_metrics_summary.csv'),
-            'general_summary_path': os.path.join(base_path, 'sd35', 'general_metrics_summary.csv')
-        }
+        model: {key: str(model_dirs[model] / file_name) for key, file_name in model_files.items()}
+        for model in models
     }
     
-    # Check if files exist
+    # Check if files exist, scanning each model directory once
+    present_files = {}
+    for model_name in model_configs:
+        try:
+            with os.scandir(model_dirs[model_name]) as entries:
+                present_files[model_name] = {entry.name for entry in entries}
+        except FileNotFoundError:
+            present_files[model_name] = set()
+    
     for model_name, config in model_configs.items():
         for file_type, file_path in config.items():
-            if not os.path.exists(file_path):
+            if model_files[file_type] not in present_files[model_name]:
                 print(f"❌ Error: {file_type} for {model_name} not found at {file_path}")
                 return
     
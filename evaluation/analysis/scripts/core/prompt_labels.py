@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Prompt labelling for IASEAI26 project.
+Maps general-metrics prompts to country, category and variant by keyword; shared
+by the single-model, step-by-step and comprehensive analysis scripts.
+"""
+
+import re
+import numpy as np
+
+# Prompt keywords per label; the first matching group wins
+COUNTRY_KEYWORDS = [
+    ('China', ['china']),
+    ('Korea', ['korea']),
+    ('India', ['india']),
+    ('Kenya', ['kenya']),
+    ('Nigeria', ['nigeria']),
+    ('United_States', ['united states', 'america'])
+]
+CATEGORY_KEYWORDS = [
+    ('architecture', ['house', 'landmark', 'building']),
+    ('art', ['dance', 'painting', 'music']),
+    ('event', ['wedding', 'funeral', 'festival', 'game', 'sport']),
+    ('fashion', ['clothing', 'accessories', 'makeup']),
+    ('food', ['food', 'dessert', 'drink']),
+    ('wildlife', ['animal', 'wildlife']),
+    ('landscape', ['landscape', 'nature'])
+]
+VARIANT_KEYWORDS = [
+    ('traditional', ['traditional']),
+    ('modern', ['modern']),
+    ('national', ['national']),
+    ('common', ['common'])
+]
+
+# (column, keywords, label for prompts matching no keyword) for each label column
+PROMPT_TAXONOMY = [
+    ('country', COUNTRY_KEYWORDS, 'Unknown'),
+    ('category', CATEGORY_KEYWORDS, 'other'),
+    ('variant', VARIANT_KEYWORDS, 'general')
+]
+
+def label_prompts(prompts, keywords, default):
+    """Label lowercased prompts by the first keyword group they contain, vectorized over the column"""
+    conditions = [
+        prompts.str.contains('|'.join(map(re.escape, words)), regex=True, na=False).to_numpy(dtype=bool)
+        for _, words in keywords
+    ]
+    return np.select(conditions, [label for label, _ in keywords], default=default)
+
+def label_order(keywords, default):
+    """All labels a column can take, sorted, for use as categorical categories"""
+    return sorted([label for label, _ in keywords] + [default])
+
+def classify_prompts(prompts):
+    """Country, category and variant label arrays for raw prompts, keyed by column name"""
+    prompts_lower = prompts.str.lower()
+    return {column: label_prompts(prompts_lower, keywords, default)
+            for column, keywords, default in PROMPT_TAXONOMY}
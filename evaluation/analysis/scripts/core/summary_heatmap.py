@@ -6,97 +6,146 @@ Creates comprehensive heatmaps showing model performance by country and metrics.
 
 import pandas as pd
 import os
+import re
 import seaborn as sns
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 import numpy as np
-
-def get_country_from_prompt(prompt):
-    """Extract country name from prompt text."""
-    if "China" in prompt:
-        return "China"
-    if "Korea" in prompt or "South Korea" in prompt:
-        return "Korea"
-    if "India" in prompt:
-        return "India"
-    if "Kenya" in prompt:
-        return "Kenya"
-    if "Nigeria" in prompt:
-        return "Nigeria"
-    if "United States" in prompt:
-        return "United States"
-    return "Unknown"
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from importlib.util import find_spec
+from prompt_labels import label_prompts
+
+# PyArrow's multi-threaded CSV reader is used when available, else pandas' C parser
+CSV_ENGINE = 'pyarrow' if find_spec('pyarrow') is not None else 'c'
+
+# Worker processes per pool; run_analysis.py sets ANALYSIS_WORKERS to this script's share
+# of the CPUs when it runs several analysis scripts at once
+MAX_WORKERS = int(os.environ.get('ANALYSIS_WORKERS', 0)) or os.cpu_count() or 1
+
+# Only these columns of general_metrics_summary.csv are used for the heatmaps
+SUMMARY_DTYPES = {
+    'prompt': 'string',
+    'best_step_by_clip': 'string',
+    'best_step_by_aesthetic': 'string',
+    'best_clip_score': 'float32',
+    'best_aesthetic': 'float32',
+}
+SUMMARY_COLUMNS = list(SUMMARY_DTYPES)
+
+# Country names as they appear in prompts, tried in this order so a prompt naming two
+# countries gets the first one listed; "South Korea" is matched by "Korea"
+PROMPT_COUNTRIES = [
+    ('China', ['China']),
+    ('Korea', ['Korea']),
+    ('India', ['India']),
+    ('Kenya', ['Kenya']),
+    ('Nigeria', ['Nigeria']),
+    ('United States', ['United States'])
+]
+# Best-step values look like 'step3_path', so the step token is anchored at the start
+STEP_RE = re.compile(r'^(step\d+)')
+
+def most_frequent_step(df, step_col):
+    """Return the most frequent step per country, breaking ties by the smallest step like Series.mode."""
+    counts = df.groupby(['country', step_col], observed=True).size().reset_index(name='count')
+    counts = counts.sort_values(['country', 'count', step_col], ascending=[True, False, True])
+    return counts.drop_duplicates('country').set_index('country')[step_col]
+
+def summarize_model(model_name, file_path):
+    """Summarize one model's scores and most frequent best steps per country."""
+    df = pd.read_csv(file_path, usecols=SUMMARY_COLUMNS, dtype=SUMMARY_DTYPES, engine=CSV_ENGINE)
+    # Keep only prompts that mention a known country
+    countries = label_prompts(df['prompt'], PROMPT_COUNTRIES, 'Unknown')
+    matched = countries != 'Unknown'
+    df = df.loc[matched].assign(country=pd.Categorical(countries[matched]))
+
+    # Extract step numbers
+    df['best_clip_step'] = df['best_step_by_clip'].str.extract(STEP_RE, expand=False)
+    df['best_aesthetic_step'] = df['best_step_by_aesthetic'].str.extract(STEP_RE, expand=False)
+
+    # Calculate average scores and most frequent best step (mode)
+    summary = df.groupby('country', observed=True)[['best_clip_score', 'best_aesthetic']].mean().rename(columns={'best_clip_score': 'avg_clip_score', 'best_aesthetic': 'avg_aesthetic_score'})
+    summary['clip_step_mode'] = most_frequent_step(df, 'best_clip_step')
+    summary['aesthetic_step_mode'] = most_frequent_step(df, 'best_aesthetic_step')
+    summary[['clip_step_mode', 'aesthetic_step_mode']] = summary[['clip_step_mode', 'aesthetic_step_mode']].fillna('N/A')
+    summary = summary.reset_index()
+
+    summary['model'] = model_name
+    return summary
 
 def create_summary_heatmap(file_paths, output_dir):
     """Create summary heatmaps for all models."""
-    all_model_data = []
-
+    available = {}
     for model_name, file_path in file_paths.items():
         if not os.path.exists(file_path):
             print(f"[INFO] Skipping {model_name}: File not found at {file_path}")
             continue
+        available[model_name] = file_path
 
-        df = pd.read_csv(file_path)
-        df['country'] = df['prompt'].apply(get_country_from_prompt)
-        df = df[df['country'] != 'Unknown']
-
-        # Extract step numbers
-        df['best_clip_step'] = df['best_step_by_clip'].str.extract(r'(step\d+)')
-        df['best_aesthetic_step'] = df['best_step_by_aesthetic'].str.extract(r'(step\d+)')
-
-        # Calculate average scores and most frequent best step (mode)
-        summary = df.groupby('country').agg(
-            avg_clip_score=('best_clip_score', 'mean'),
-            avg_aesthetic_score=('best_aesthetic', 'mean'),
-            clip_step_mode=('best_clip_step', lambda x: x.mode()[0] if not x.mode().empty else 'N/A'),
-            aesthetic_step_mode=('best_aesthetic_step', lambda x: x.mode()[0] if not x.mode().empty else 'N/A')
-        ).reset_index()
-
-        summary['model'] = model_name
-        all_model_data.append(summary)
-
-    if not all_model_data:
+    if not available:
         print("[ERROR] No data to process. Halting heatmap generation.")
         return
 
-    combined_df = pd.concat(all_model_data)
-
-    # Create heatmaps
-    plot_heatmap(
-        df=combined_df,
-        value_col='avg_clip_score',
-        annot_col='clip_step_mode',
-        title='Average CLIP Score by Model and Country (Color) with Best Step (Text)',
-        save_path=os.path.join(output_dir, 'summary_heatmap_clip_score.png')
-    )
-
-    plot_heatmap(
-        df=combined_df,
-        value_col='avg_aesthetic_score',
-        annot_col='aesthetic_step_mode',
-        title='Average Aesthetic Score by Model and Country (Color) with Best Step (Text)',
-        save_path=os.path.join(output_dir, 'summary_heatmap_aesthetic_score.png')
-    )
-
-def plot_heatmap(df, value_col, annot_col, title, save_path):
-    """Helper function to plot a heatmap."""
-    try:
-        value_pivot = df.pivot(index='country', columns='model', values=value_col)
-        annot_pivot = df.pivot(index='country', columns='model', values=annot_col)
-    except Exception as e:
-        print(f"[ERROR] Failed to pivot data for {title}: {e}")
-        return
-
-    plt.figure(figsize=(12, 8))
-    sns.heatmap(value_pivot, annot=annot_pivot, fmt='s', cmap='viridis', linewidths=.5, cbar_kws={'label': 'Average Score'})
-    plt.title(title, fontsize=16)
-    plt.xlabel("Model", fontsize=12)
-    plt.ylabel("Country", fontsize=12)
-    plt.xticks(rotation=45)
-    plt.yticks(rotation=0)
-    plt.tight_layout()
-    plt.savefig(save_path, dpi=300, bbox_inches='tight')
-    plt.close()
-    print(f"Generated: {save_path}")
+    # Each model's CSV is summarized independently, so process them in parallel
+    with ProcessPoolExecutor(max_workers=min(len(available), MAX_WORKERS)) as executor:
+        all_model_data = list(executor.map(summarize_model, available.keys(), available.values()))
+
+    # Every summary has at most one row per country, so fill the country x model
+    # matrices directly instead of concatenating and pivoting the summaries
+    models = sorted(available)
+    countries = sorted(set().union(*(summary['country'] for summary in all_model_data)))
+    country_index = {country: i for i, country in enumerate(countries)}
+
+    shape = (len(countries), len(models))
+    matrices = {
+        'avg_clip_score': np.full(shape, np.nan, dtype=np.float32),
+        'avg_aesthetic_score': np.full(shape, np.nan, dtype=np.float32),
+        'clip_step_mode': np.full(shape, np.nan, dtype=object),
+        'aesthetic_step_mode': np.full(shape, np.nan, dtype=object)
+    }
+    for model_name, summary in zip(available, all_model_data):
+        rows = summary['country'].astype(str).map(country_index).to_numpy()
+        column = models.index(model_name)
+        for col, matrix in matrices.items():
+            matrix[rows, column] = summary[col].to_numpy()
+
+    index = pd.Index(countries, name='country')
+    columns = pd.Index(models, name='model')
+    pivots = {col: pd.DataFrame(matrix, index=index, columns=columns) for col, matrix in matrices.items()}
+
+    # Render both heatmaps concurrently; PNG encoding at 300 dpi dominates
+    heatmaps = [
+        ('avg_clip_score', 'clip_step_mode',
+         'Average CLIP Score by Model and Country (Color) with Best Step (Text)',
+         'summary_heatmap_clip_score.png'),
+        ('avg_aesthetic_score', 'aesthetic_step_mode',
+         'Average Aesthetic Score by Model and Country (Color) with Best Step (Text)',
+         'summary_heatmap_aesthetic_score.png')
+    ]
+    with ThreadPoolExecutor(max_workers=len(heatmaps)) as executor:
+        futures = [
+            executor.submit(plot_heatmap, pivots[value_col], pivots[annot_col], title,
+                            os.path.join(output_dir, file_name))
+            for value_col, annot_col, title, file_name in heatmaps
+        ]
+        # Report in submission order so the log does not depend on which render finishes first
+        for future in futures:
+            print(f"Generated: {future.result()}")
+
+def plot_heatmap(value_pivot, annot_pivot, title, save_path):
+    """Helper function to plot a heatmap from country x model matrices; returns the saved path."""
+    # Use a standalone Figure rather than pyplot's global state so this is thread-safe
+    fig = Figure(figsize=(12, 8))
+    ax = fig.subplots()
+    sns.heatmap(value_pivot, annot=annot_pivot, fmt='s', cmap='viridis', linewidths=.5,
+                cbar_kws={'label': 'Average Score'}, ax=ax)
+    ax.set_title(title, fontsize=16)
+    ax.set_xlabel("Model", fontsize=12)
+    ax.set_ylabel("Country", fontsize=12)
+    ax.tick_params(axis='x', labelrotation=45)
+    ax.tick_params(axis='y', labelrotation=0)
+    fig.tight_layout()
+    fig.savefig(save_path, dpi=300, bbox_inches='tight')
+    return save_path
 
 def main():
     """Main function to create summary heatmaps."""
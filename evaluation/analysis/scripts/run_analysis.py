@@ -8,6 +8,10 @@ import os
 import sys
 import subprocess
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+# Analysis scripts launched concurrently by the pipeline
+MAX_PARALLEL_SCRIPTS = 4
 
 def run_single_model_analysis(model_name, analysis_type):
     """Run analysis for a single model."""
@@ -25,7 +29,7 @@ def run_single_model_analysis(model_name, analysis_type):
 
     try:
         print(f"\n🔍 Running {analysis_type} analysis for {model_name.upper()}...")
-        result = subprocess.run(cmd, check=True, capture_output=True, text=True)
+        subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
         print(f"✅ {analysis_type.title()} analysis completed for {model_name.upper()}")
         return True
     except subprocess.CalledProcessError as e:
@@ -42,7 +46,7 @@ def run_core_analysis():
 
     try:
         print("🔍 Running core metrics analysis...")
-        result = subprocess.run([sys.executable, script_path], check=True, capture_output=True, text=True)
+        subprocess.run([sys.executable, script_path], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
         print("✅ Core metrics analysis completed")
         return True
     except subprocess.CalledProcessError as e:
@@ -59,7 +63,7 @@ def run_summary_analysis():
 
     try:
         print("🔍 Running summary heatmap analysis...")
-        result = subprocess.run([sys.executable, script_path], check=True, capture_output=True, text=True)
+        subprocess.run([sys.executable, script_path], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
         print("✅ Summary heatmap analysis completed")
         return True
     except subprocess.CalledProcessError as e:
@@ -83,7 +87,7 @@ def run_multi_model_analysis(analysis_type):
 
     try:
         print(f"\n🔍 Running multi-model {analysis_type} comparison...")
-        result = subprocess.run([sys.executable, script_path], check=True, capture_output=True, text=True)
+        subprocess.run([sys.executable, script_path], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
         print(f"✅ Multi-model {analysis_type} comparison completed")
         return True
     except subprocess.CalledProcessError as e:
@@ -98,12 +102,17 @@ def check_data_availability(models):
     script_dir = os.path.dirname(os.path.abspath(__file__))
     output_dir = os.path.join(script_dir, '..', '..', 'output')
 
+    required_files = {"cultural_metrics.csv", "general_metrics.csv"}
+
     missing_models = []
     for model in models:
-        cultural_path = os.path.join(output_dir, model, "cultural_metrics.csv")
-        general_path = os.path.join(output_dir, model, "general_metrics.csv")
+        # List each model directory once instead of stat-ing every required file
+        try:
+            existing_files = set(os.listdir(os.path.join(output_dir, model)))
+        except FileNotFoundError:
+            existing_files = set()
 
-        if not os.path.exists(cultural_path) or not os.path.exists(general_path):
+        if not required_files <= existing_files:
             missing_models.append(model)
 
     if missing_models:
@@ -131,49 +140,41 @@ def main():
     if not check_data_availability(args.models):
         return
 
-    success_count = 0
-    total_count = 0
+    # Collect (runner, args) jobs first, then launch the scripts concurrently
+    jobs = []
 
     if args.analysis_type == 'all' or args.analysis_type == 'single':
         if args.analysis_type == 'single' and not args.single_type:
             print("❌ Error: --single-type is required when using --analysis-type single")
             return
 
-        if args.analysis_type == 'all':
-            # Run both cultural and general single model analyses
-            for single_type in ['cultural', 'general']:
-                print(f"\n📊 Running single model analyses ({single_type})...")
-                for model in args.models:
-                    total_count += 1
-                    if run_single_model_analysis(model, single_type):
-                        success_count += 1
-        else:
-            # Run single model analysis for specified type
-            print(f"\n📊 Running single model analyses ({args.single_type})...")
+        single_types = ['cultural', 'general'] if args.analysis_type == 'all' else [args.single_type]
+        for single_type in single_types:
+            print(f"\n📊 Queueing single model analyses ({single_type})...")
             for model in args.models:
-                total_count += 1
-                if run_single_model_analysis(model, args.single_type):
-                    success_count += 1
+                jobs.append((run_single_model_analysis, (model, single_type)))
 
     if args.analysis_type == 'all' or args.analysis_type == 'core':
-        print("📈 Running core analyses...")
-        total_count += 1
-        if run_core_analysis():
-            success_count += 1
-
-        total_count += 1
-        if run_summary_analysis():
-            success_count += 1
+        print("📈 Queueing core analyses...")
+        jobs.append((run_core_analysis, ()))
+        jobs.append((run_summary_analysis, ()))
 
     if args.analysis_type == 'all' or args.analysis_type == 'multi':
-        print("🔍 Running multi-model comparisons...")
-        total_count += 1
-        if run_multi_model_analysis("cultural"):
-            success_count += 1
-
-        total_count += 1
-        if run_multi_model_analysis("general"):
-            success_count += 1
+        print("🔍 Queueing multi-model comparisons...")
+        jobs.append((run_multi_model_analysis, ("cultural",)))
+        jobs.append((run_multi_model_analysis, ("general",)))
+
+    # Every script is independent and each worker thread just waits on its own
+    # subprocess, so a few scripts run at once; the CPUs are split between them so
+    # their own process pools don't multiply into cpu_count x cpu_count workers
+    cpu_count = os.cpu_count() or 1
+    script_workers = max(1, min(MAX_PARALLEL_SCRIPTS, cpu_count, len(jobs)))
+    os.environ['ANALYSIS_WORKERS'] = str(max(1, cpu_count // script_workers))
+    with ThreadPoolExecutor(max_workers=script_workers) as executor:
+        results = list(executor.map(lambda job: job[0](*job[1]), jobs))
+
+    success_count = sum(results)
+    total_count = len(jobs)
 
     print("\n" + "=" * 60)
     print(f"🎉 Analysis pipeline completed! ({success_count}/{total_count} successful)")
@@ -6,17 +6,128 @@ Analyzes cultural performance metrics for individual models.
 
 import pandas as pd
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
+from matplotlib import cbook
+from matplotlib.figure import Figure
+from matplotlib.lines import Line2D
 import seaborn as sns
 import os
+import re
+import io
+import contextlib
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from importlib.util import find_spec
 
 # Set up plotting style
 plt.style.use('default')
 sns.set_palette("husl")
 
+# PyArrow's multi-threaded CSV reader is used when available, else pandas' C parser
+CSV_ENGINE = 'pyarrow' if find_spec('pyarrow') is not None else 'c'
+
+# Worker processes per pool; run_analysis.py sets ANALYSIS_WORKERS to this script's share
+# of the CPUs when it runs several analysis scripts at once
+MAX_WORKERS = int(os.environ.get('ANALYSIS_WORKERS', 0)) or os.cpu_count() or 1
+
+# Aggregates are cached as parquet under the results tree (never next to the input
+# CSVs), which also needs pyarrow; stale caches are matched by this exact file pattern
+HAS_PARQUET = find_spec('pyarrow') is not None
+AGGREGATE_CACHE_RE = re.compile(r'\.cache_country_step_\d+\.parquet')
+
+# Label columns are read as Arrow-backed strings (contiguous buffers instead of one
+# Python object per cell); numeric columns stay NumPy so seaborn/NumPy accept them
+LABEL_DTYPE = 'string[pyarrow]' if CSV_ENGINE == 'pyarrow' else 'string'
+SUMMARY_LABEL_DTYPES = {col: LABEL_DTYPE for col in ['country', 'category', 'sub_category', 'variant', 'step']}
+DETAILED_LABEL_DTYPES = {col: LABEL_DTYPE for col in ['country', 'category']}
+
+# Quality scores are 1-5 ratings and best/worst are flags, so both fit in one byte; the
+# nullable dtypes keep files with a blank rating or flag loadable (means skip the gaps)
+SUMMARY_VALUE_DTYPES = {
+    'cultural_representative': 'Int8', 'prompt_alignment': 'Int8',
+    'is_best': 'boolean', 'is_worst': 'boolean'
+}
+
+# Only these columns are used; the detailed file's question text is never read
+SUMMARY_COLUMNS = list(SUMMARY_LABEL_DTYPES) + [
+    'uid', 'accuracy', 'precision', 'recall', 'f1', 'processing_time',
+    'cultural_representative', 'prompt_alignment', 'is_best', 'is_worst'
+]
+DETAILED_COLUMNS = list(DETAILED_LABEL_DTYPES)
+
+# Analysis charts are rendered at screen resolution without the tight-bbox pass and
+# written with light PNG compression; heatmaps with more cells than this are drawn
+# without per-cell annotations
+SAVE_KW = {'dpi': 120, 'bbox_inches': None, 'pil_kwargs': {'compress_level': 1}}
+ANNOT_MAX_CELLS = 200
+
+# Named aggregations computed once per country/step cell for the heatmaps, followed
+# by the best/worst image counts and shares, which are counted on integer codes
+COUNTRY_STEP_AGGREGATES = {
+    'cultural': ('cultural_representative', 'mean'),
+    'alignment': ('prompt_alignment', 'mean'),
+    'processing': ('processing_time', 'mean'),
+    'f1': ('f1', 'mean'),
+    'accuracy': ('accuracy', 'mean'),
+    'combined': ('combined_quality', 'mean')
+}
+COUNTRY_STEP_COLUMNS = list(COUNTRY_STEP_AGGREGATES) + ['best', 'worst', 'best_count', 'worst_count']
+
+# Metrics reported per country/category/variant/step, and the finest grain they are cached at
+REPORT_METRICS = ['accuracy', 'precision', 'recall', 'f1', 'processing_time']
+CELL_KEYS = ['country', 'category', 'variant', 'step_num']
+
+# One Figure per process is reused by every chart instead of creating one per plot
+_plot_figure = None
+
+def parse_step_numbers(steps):
+    """Parse 'stepN'/'N' labels (at most 8 characters) to ints without regex, -1 where there are no digits"""
+    # View each label as 8 UTF-32 code points and keep the ASCII digits
+    chars = steps.to_numpy(dtype='U8').view(np.uint32).reshape(len(steps), 8)
+    digits = chars.astype(np.int64) - ord('0')
+    is_digit = (digits >= 0) & (digits <= 9)
+
+    # A digit's place value is 10 ** (number of digits to its right)
+    exponents = is_digit[:, ::-1].cumsum(axis=1)[:, ::-1] - is_digit
+    values = (np.where(is_digit, digits, 0) * 10 ** exponents).sum(axis=1)
+    return np.where(is_digit.any(axis=1), values, -1)
+
+def get_plot_figure(figsize):
+    """Return this process's reusable Figure, cleared and resized for the next chart"""
+    global _plot_figure
+    if _plot_figure is None:
+        _plot_figure = Figure()
+    _plot_figure.clf()
+    _plot_figure.set_size_inches(figsize)
+    return _plot_figure
+
+# Analyzer copy held by each plotting worker process
+_worker_analyzer = None
+
+def _init_plot_worker(analyzer):
+    """Keep one copy of the analyzer per worker process"""
+    global _worker_analyzer
+    _worker_analyzer = analyzer
+
+def _run_plot(method_name):
+    """Render one chart in a worker and return what it printed"""
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer):
+        getattr(_worker_analyzer, method_name)()
+    return buffer.getvalue()
+
+def _appearance_codes(column):
+    """Codes of a categorical column renumbered by first appearance, with the matching labels"""
+    codes = column.cat.codes.to_numpy(np.int64)
+    first_seen = pd.unique(codes[codes >= 0])
+    rank = np.empty(len(column.cat.categories), dtype=np.int64)
+    rank[first_seen] = np.arange(len(first_seen))
+    return np.where(codes >= 0, rank[codes], -1), column.cat.categories[first_seen]
+
 class CulturalMetricsAnalyzer:
-    def __init__(self, cultural_metrics_path, cultural_summary_path, model_name="Model"):
+    def __init__(self, cultural_metrics_path, cultural_summary_path, model_name="Model", aggregate_cache_path=None):
         """
         Initialize the analyzer with paths to cultural metrics files
 
@@ -24,10 +135,12 @@ class CulturalMetricsAnalyzer:
             cultural_metrics_path: Path to detailed cultural metrics CSV
             cultural_summary_path: Path to cultural metrics summary CSV
             model_name: Name of the model for display purposes
+            aggregate_cache_path: Optional parquet file caching the country/step aggregates
         """
         self.cultural_metrics_path = cultural_metrics_path
         self.cultural_summary_path = cultural_summary_path
         self.model_name = model_name
+        self.aggregate_cache_path = aggregate_cache_path
 
         # Set up charts directory based on model name
         script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -35,8 +148,11 @@ class CulturalMetricsAnalyzer:
         os.makedirs(self.charts_dir, exist_ok=True)
 
         # Load data
-        self.detailed_df = pd.read_csv(cultural_metrics_path)
-        self.summary_df = pd.read_csv(cultural_summary_path)
+        self.detailed_df = pd.read_csv(cultural_metrics_path, usecols=DETAILED_COLUMNS,
+                                       dtype=DETAILED_LABEL_DTYPES, engine=CSV_ENGINE)
+        self.summary_df = pd.read_csv(cultural_summary_path, usecols=SUMMARY_COLUMNS,
+                                      dtype={**SUMMARY_LABEL_DTYPES, **SUMMARY_VALUE_DTYPES},
+                                      engine=CSV_ENGINE)
 
         # Clean and prepare data
         self._prepare_data()
@@ -61,8 +177,160 @@ class CulturalMetricsAnalyzer:
             self.summary_df['variant']
         )
 
+        # Average of the two quality scores, computed once rather than each time the
+        # heatmaps are drawn; the scores are small whole numbers, so float32 is exact
+        self.summary_df['combined_quality'] = ((self.summary_df['cultural_representative'].astype(np.float32) +
+                                               self.summary_df['prompt_alignment'].astype(np.float32)) * 0.5)
+
         # Extract step numbers for better sorting
-        self.summary_df['step_num'] = self.summary_df['step'].str.extract('(\d+)').fillna('-1').astype(int)
+        self.summary_df['step_num'] = parse_step_numbers(self.summary_df['step'])
+
+        # Group and filter on integer codes rather than hashing strings
+        for col in ['country', 'category', 'sub_category', 'variant', 'step']:
+            self.summary_df[col] = self.summary_df[col].astype('category')
+
+        # Aggregate counts, means and variances once at the finest grain;
+        # the per-axis reports pool this small table instead of rescanning
+        values = self.summary_df[REPORT_METRICS]
+        grouped = values.groupby([self.summary_df[key] for key in CELL_KEYS], sort=False, observed=True)
+        cell_stats = pd.concat({
+            'count': grouped.count(),
+            'mean': grouped.mean(),
+            'var': grouped.var()
+        }, axis=1)
+
+        self._country_stats = self._rollup_stats(cell_stats, 'country')
+        self._category_stats = self._rollup_stats(cell_stats, 'category')
+        self._variant_stats = self._rollup_stats(cell_stats, 'variant')
+        self._step_stats = self._rollup_stats(cell_stats, 'step_num')
+
+        # Cache best/worst subsets and per-country/step totals reused by reports and plots
+        self._best_mask = self.summary_df['is_best'].to_numpy(dtype=bool, na_value=False)
+        self._worst_mask = self.summary_df['is_worst'].to_numpy(dtype=bool, na_value=False)
+        self._best_df = self.summary_df.loc[self._best_mask]
+        self._worst_df = self.summary_df.loc[self._worst_mask]
+        self._total_by_country = self.summary_df['country'].value_counts(sort=False)
+        self._total_by_step = self.summary_df['step'].value_counts(sort=False)
+
+        # Country/step labels, and one groupby over country/step unstacked once into a
+        # country x (metric, step) grid that every country-step heatmap slices
+        self._country_cats = self.summary_df['country'].cat.categories
+        self._step_cats = self.summary_df['step'].cat.categories
+        self._country_step_grid = self._load_country_step_means().unstack('step')
+
+        # Row order and group boundaries for the distribution plots, so each
+        # box/violin panel only slices a sorted column instead of re-grouping
+        self._group_splits = {}
+        for key in ['country', 'category', 'variant']:
+            codes = self.summary_df[key].cat.codes.to_numpy()
+            order = np.argsort(codes, kind='stable')
+            group_codes, starts = np.unique(codes[order], return_index=True)
+            labels = self.summary_df[key].cat.categories[group_codes]
+            self._group_splits[key] = (order, starts[1:], labels)
+
+    def _load_country_step_means(self):
+        """Country/step metric means, read from the parquet cache when it exists"""
+        if self.aggregate_cache_path and os.path.exists(self.aggregate_cache_path):
+            cached = pd.read_parquet(self.aggregate_cache_path)
+            # A cache written with a different set of aggregates is rebuilt
+            if list(cached.columns) == COUNTRY_STEP_COLUMNS:
+                return cached
+
+        df = self.summary_df
+        means = df.groupby(['country', 'step'], observed=True).agg(**COUNTRY_STEP_AGGREGATES)
+
+        # Best/worst counts per cell from bincount over one combined country/step code,
+        # read back at the observed cells of the grouped index
+        n_steps = len(self._step_cats)
+        size = len(self._country_cats) * n_steps
+        cell_codes = df['country'].cat.codes.to_numpy(np.int64) * n_steps + df['step'].cat.codes.to_numpy()
+        observed = (self._country_cats.get_indexer(means.index.get_level_values('country')) * n_steps +
+                    self._step_cats.get_indexer(means.index.get_level_values('step')))
+        totals = np.bincount(cell_codes, minlength=size)[observed]
+        flag_counts = {
+            flag: np.bincount(cell_codes, weights=df[f'is_{flag}'].to_numpy(dtype=float, na_value=0), minlength=size)[observed].astype(np.int64)
+            for flag in ['best', 'worst']
+        }
+        means['best'] = flag_counts['best'] / totals
+        means['worst'] = flag_counts['worst'] / totals
+        means['best_count'] = flag_counts['best']
+        means['worst_count'] = flag_counts['worst']
+
+        if self.aggregate_cache_path:
+            # Drop this cache's files written for older versions of the input files
+            cache_dir = os.path.dirname(self.aggregate_cache_path)
+            os.makedirs(cache_dir, exist_ok=True)
+            for name in os.listdir(cache_dir):
+                if AGGREGATE_CACHE_RE.fullmatch(name):
+                    os.remove(os.path.join(cache_dir, name))
+            means.to_parquet(self.aggregate_cache_path, compression='zstd')
+        return means
+
+    def _rollup_stats(self, cell_stats, key):
+        """Pool cached cell counts, means and variances into mean/std/count columns per key"""
+        counts, cell_means = cell_stats['count'], cell_stats['mean']
+        totals = counts.groupby(level=key, observed=True).sum()
+        means = (counts * cell_means).groupby(level=key, observed=True).sum() / totals
+        # Within-cell plus between-cell squared deviations; avoids the cancellation of sum(x^2) - n*mean^2
+        deviations = cell_means - means.reindex(cell_stats.index.get_level_values(key)).to_numpy()
+        squares = (counts - 1) * cell_stats['var'].fillna(0) + counts * deviations ** 2
+        stds = np.sqrt(squares.groupby(level=key, observed=True).sum() / (totals - 1))
+        stats = pd.DataFrame(index=totals.index)
+        for metric in REPORT_METRICS:
+            stats[f'{metric}_mean'] = means[metric]
+            stats[f'{metric}_std'] = stds[metric]
+            stats[f'{metric}_count'] = totals[metric]
+        return stats.round(3)
+
+    def _grouped_values(self, key, column):
+        """Split a column into per-group arrays (NaNs dropped) in category order"""
+        order, boundaries, labels = self._group_splits[key]
+        values = self.summary_df[column].to_numpy(dtype=float)[order]
+        groups = [group[~np.isnan(group)] for group in np.split(values, boundaries)]
+        return labels, groups
+
+    def _draw_boxplot(self, ax, key, column):
+        """Draw per-group box plots with matplotlib from precomputed quartile/whisker stats"""
+        labels, groups = self._grouped_values(key, column)
+        stats = cbook.boxplot_stats(groups, labels=labels)
+        line = {'color': '0.3'}
+        ax.bxp(stats, widths=0.8, patch_artist=True,
+               boxprops={'facecolor': sns.desaturate(sns.color_palette()[0], 0.75), 'edgecolor': '0.3'},
+               medianprops=line, whiskerprops=line, capprops=line,
+               flierprops={'markeredgecolor': '0.3'})
+
+    def _draw_heatmap(self, ax, pivot, fmt, cmap, label, **kwargs):
+        """Draw a country/step heatmap from a row-major copy of the pivot"""
+        values = np.ascontiguousarray(pivot.to_numpy(dtype=float))
+        data = pd.DataFrame(values, index=pivot.index, columns=pivot.columns)
+
+        # Format the annotation text in one vectorized pass rather than per cell while drawing
+        annot = np.char.mod(f'%{fmt}', values) if values.size <= ANNOT_MAX_CELLS else False
+        sns.heatmap(data, annot=annot, fmt='', cmap=cmap,
+                    ax=ax, cbar_kws={'label': label}, **kwargs)
+
+    def _draw_country_scatter(self, ax, df, x, y, alpha, s=None, **legend_kws):
+        """Scatter x vs y colored by country in one ax.scatter call, with a per-country legend"""
+        countries = self._country_cats
+        # Same colors seaborn picks for a hue: the active palette, or husl when it is too short
+        if len(countries) <= len(sns.color_palette()):
+            palette = np.asarray(sns.color_palette(n_colors=len(countries)))
+        else:
+            palette = np.asarray(sns.color_palette('husl', len(countries)))
+
+        x_values = df[x].to_numpy(dtype=float)
+        y_values = df[y].to_numpy(dtype=float)
+        valid = ~(np.isnan(x_values) | np.isnan(y_values))
+        size = s if s is not None else plt.rcParams['lines.markersize'] ** 2
+        linewidth = 0.08 * np.sqrt(size)
+        ax.scatter(x_values[valid], y_values[valid], s=size,
+                   c=palette[df['country'].cat.codes.to_numpy()[valid]],
+                   alpha=alpha, edgecolors='w', linewidths=linewidth)
+
+        handles = [Line2D([], [], linestyle='', marker='o', markersize=np.sqrt(size), color=color,
+                          markeredgecolor='w', markeredgewidth=linewidth, alpha=alpha)
+                   for color in palette]
+        ax.legend(handles, list(countries), **{'title': 'country', **legend_kws})
 
     def analyze_overall_performance(self):
         """Analyze overall cultural performance across all metrics"""
@@ -72,9 +340,9 @@ class CulturalMetricsAnalyzer:
 
         # Overall statistics
         total_evaluations = len(self.summary_df)
-        countries = self.summary_df['country'].unique()
-        categories = self.summary_df['category'].unique()
-        variants = self.summary_df['variant'].unique()
+        countries = self._country_cats
+        categories = self.summary_df['category'].cat.categories
+        variants = self.summary_df['variant'].cat.categories
 
         print(f"\nDataset Overview:")
         print(f"- Total evaluations: {total_evaluations}")
@@ -103,16 +371,7 @@ class CulturalMetricsAnalyzer:
         print("COUNTRY-SPECIFIC ANALYSIS")
         print("=" * 60)
 
-        country_stats = self.summary_df.groupby('country').agg({
-            'accuracy': ['mean', 'std', 'count'],
-            'precision': ['mean', 'std'],
-            'recall': ['mean', 'std'],
-            'f1': ['mean', 'std'],
-            'processing_time': ['mean', 'std']
-        }).round(3)
-
-        # Flatten column names
-        country_stats.columns = ['_'.join(col).strip() for col in country_stats.columns]
+        country_stats = self._country_stats
 
         print(f"\nPerformance by Country:")
         for country in sorted(country_stats.index):
@@ -132,32 +391,26 @@ class CulturalMetricsAnalyzer:
         print("=" * 60)
 
         # Performance by main category
-        category_stats = self.summary_df.groupby('category').agg({
-            'accuracy': ['mean', 'std', 'count'],
-            'f1': ['mean', 'std']
-        }).round(3)
+        category_stats = self._category_stats
 
         print(f"\nPerformance by Category:")
         for category in sorted(category_stats.index):
             stats = category_stats.loc[category]
             print(f"\n{category.upper()}:")
-            print(f"  Evaluations: {int(stats[('accuracy', 'count')])}")
-            print(f"  Accuracy: {stats[('accuracy', 'mean')]:.3f} ± {stats[('accuracy', 'std')]:.3f}")
-            print(f"  F1-Score: {stats[('f1', 'mean')]:.3f} ± {stats[('f1', 'std')]:.3f}")
+            print(f"  Evaluations: {int(stats['accuracy_count'])}")
+            print(f"  Accuracy: {stats['accuracy_mean']:.3f} ± {stats['accuracy_std']:.3f}")
+            print(f"  F1-Score: {stats['f1_mean']:.3f} ± {stats['f1_std']:.3f}")
 
         # Performance by variant (traditional, modern, general)
-        variant_stats = self.summary_df.groupby('variant').agg({
-            'accuracy': ['mean', 'std', 'count'],
-            'f1': ['mean', 'std']
-        }).round(3)
+        variant_stats = self._variant_stats
 
         print(f"\nPerformance by Variant:")
         for variant in sorted(variant_stats.index):
             stats = variant_stats.loc[variant]
             print(f"\n{variant.upper()}:")
-            print(f"  Evaluations: {int(stats[('accuracy', 'count')])}")
-            print(f"  Accuracy: {stats[('accuracy', 'mean')]:.3f} ± {stats[('accuracy', 'std')]:.3f}")
-            print(f"  F1-Score: {stats[('f1', 'mean')]:.3f} ± {stats[('f1', 'std')]:.3f}")
+            print(f"  Evaluations: {int(stats['accuracy_count'])}")
+            print(f"  Accuracy: {stats['accuracy_mean']:.3f} ± {stats['accuracy_std']:.3f}")
+            print(f"  F1-Score: {stats['f1_mean']:.3f} ± {stats['f1_std']:.3f}")
 
     def analyze_step_performance(self):
         """Analyze performance across different steps"""
@@ -165,11 +418,7 @@ class CulturalMetricsAnalyzer:
         print("STEP-WISE PERFORMANCE ANALYSIS")
         print("=" * 60)
 
-        step_stats = self.summary_df.groupby('step_num').agg({
-            'accuracy': ['mean', 'std', 'count'],
-            'f1': ['mean', 'std'],
-            'processing_time': ['mean', 'std']
-        }).round(3)
+        step_stats = self._step_stats
 
         print(f"\nPerformance by Step:")
         for step_num in sorted(step_stats.index):
@@ -180,10 +429,10 @@ class CulturalMetricsAnalyzer:
 
             stats = step_stats.loc[step_num]
             print(f"\n{step_name.upper()}:")
-            print(f"  Evaluations: {int(stats[('accuracy', 'count')])}")
-            print(f"  Accuracy: {stats[('accuracy', 'mean')]:.3f} ± {stats[('accuracy', 'std')]:.3f}")
-            print(f"  F1-Score: {stats[('f1', 'mean')]:.3f} ± {stats[('f1', 'std')]:.3f}")
-            print(f"  Processing Time: {stats[('processing_time', 'mean')]:.2f}s ± {stats[('processing_time', 'std')]:.2f}s")
+            print(f"  Evaluations: {int(stats['accuracy_count'])}")
+            print(f"  Accuracy: {stats['accuracy_mean']:.3f} ± {stats['accuracy_std']:.3f}")
+            print(f"  F1-Score: {stats['f1_mean']:.3f} ± {stats['f1_std']:.3f}")
+            print(f"  Processing Time: {stats['processing_time_mean']:.2f}s ± {stats['processing_time_std']:.2f}s")
 
     def identify_best_worst_performers(self):
         """Identify best and worst performing combinations"""
@@ -194,14 +443,14 @@ class CulturalMetricsAnalyzer:
         # Best performers by F1 score
         best_f1 = self.summary_df.nlargest(10, 'f1')[['country', 'category', 'sub_category', 'variant', 'step', 'f1', 'accuracy']]
         print(f"\nTop 10 Best Performers (by F1-Score):")
-        for idx, row in best_f1.iterrows():
-            print(f"  {row['country']} - {row['category']}/{row['sub_category']}/{row['variant']} ({row['step']}): F1={row['f1']:.3f}, Acc={row['accuracy']:.3f}")
+        for country, category, sub_category, variant, step, f1, accuracy in best_f1.itertuples(index=False, name=None):
+            print(f"  {country} - {category}/{sub_category}/{variant} ({step}): F1={f1:.3f}, Acc={accuracy:.3f}")
 
         # Worst performers by F1 score
         worst_f1 = self.summary_df.nsmallest(10, 'f1')[['country', 'category', 'sub_category', 'variant', 'step', 'f1', 'accuracy']]
         print(f"\nTop 10 Worst Performers (by F1-Score):")
-        for idx, row in worst_f1.iterrows():
-            print(f"  {row['country']} - {row['category']}/{row['sub_category']}/{row['variant']} ({row['step']}): F1={row['f1']:.3f}, Acc={row['accuracy']:.3f}")
+        for country, category, sub_category, variant, step, f1, accuracy in worst_f1.itertuples(index=False, name=None):
+            print(f"  {country} - {category}/{sub_category}/{variant} ({step}): F1={f1:.3f}, Acc={accuracy:.3f}")
 
     def analyze_image_quality_metrics(self):
         """Analyze actual image quality metrics (not VLM performance)"""
@@ -210,8 +459,8 @@ class CulturalMetricsAnalyzer:
         print("=" * 60)
 
         # Best/Worst image analysis
-        best_images = self.summary_df[self.summary_df['is_best'] == True]
-        worst_images = self.summary_df[self.summary_df['is_worst'] == True]
+        best_images = self._best_df
+        worst_images = self._worst_df
 
         print(f"\nImage Quality Distribution:")
         print(f"- Total evaluations: {len(self.summary_df)}")
@@ -239,70 +488,43 @@ class CulturalMetricsAnalyzer:
         print("BEST/WORST IMAGES BY COUNTRY & STEP")
         print("=" * 60)
 
-        # Best images by country
-        best_by_country = self.summary_df[self.summary_df['is_best'] == True].groupby('country').agg({
-            'uid': 'count',
-            'cultural_representative': 'mean',
-            'prompt_alignment': 'mean'
-        }).round(2)
-        best_by_country.columns = ['best_count', 'avg_cultural_rep', 'avg_prompt_align']
-
+        # Best and worst are grouped separately since an image can carry both flags
         print(f"\nBest Images by Country:")
-        for country in best_by_country.index:
-            stats = best_by_country.loc[country]
-            total_country_images = len(self.summary_df[self.summary_df['country'] == country])
-            percentage = (stats['best_count'] / total_country_images) * 100
-            print(f"  {country}: {int(stats['best_count'])} best images ({percentage:.1f}% of country's images)")
-            print(f"    Avg Cultural Rep: {stats['avg_cultural_rep']:.2f}")
-            print(f"    Avg Prompt Alignment: {stats['avg_prompt_align']:.2f}")
-
-        # Worst images by country
-        worst_by_country = self.summary_df[self.summary_df['is_worst'] == True].groupby('country').agg({
-            'uid': 'count',
-            'cultural_representative': 'mean',
-            'prompt_alignment': 'mean'
-        }).round(2)
-        worst_by_country.columns = ['worst_count', 'avg_cultural_rep', 'avg_prompt_align']
+        self._print_kind_breakdown(self._kind_breakdown(self._best_df, 'country'), self._total_by_country, 'best', 'country')
 
         print(f"\nWorst Images by Country:")
-        for country in worst_by_country.index:
-            stats = worst_by_country.loc[country]
-            total_country_images = len(self.summary_df[self.summary_df['country'] == country])
-            percentage = (stats['worst_count'] / total_country_images) * 100
-            print(f"  {country}: {int(stats['worst_count'])} worst images ({percentage:.1f}% of country's images)")
-            print(f"    Avg Cultural Rep: {stats['avg_cultural_rep']:.2f}")
-            print(f"    Avg Prompt Alignment: {stats['avg_prompt_align']:.2f}")
+        self._print_kind_breakdown(self._kind_breakdown(self._worst_df, 'country'), self._total_by_country, 'worst', 'country')
 
         # Best/Worst by step
         print(f"\nBest Images by Step:")
-        best_by_step = self.summary_df[self.summary_df['is_best'] == True].groupby('step').agg({
-            'uid': 'count',
-            'cultural_representative': 'mean',
-            'prompt_alignment': 'mean'
-        }).round(2)
-
-        for step in best_by_step.index:
-            stats = best_by_step.loc[step]
-            total_step_images = len(self.summary_df[self.summary_df['step'] == step])
-            percentage = (stats['uid'] / total_step_images) * 100
-            print(f"  {step}: {int(stats['uid'])} best images ({percentage:.1f}% of step's images)")
-            print(f"    Avg Cultural Rep: {stats['cultural_representative']:.2f}")
-            print(f"    Avg Prompt Alignment: {stats['prompt_alignment']:.2f}")
+        self._print_kind_breakdown(self._kind_breakdown(self._best_df, 'step'), self._total_by_step, 'best', 'step')
 
         print(f"\nWorst Images by Step:")
-        worst_by_step = self.summary_df[self.summary_df['is_worst'] == True].groupby('step').agg({
-            'uid': 'count',
-            'cultural_representative': 'mean',
-            'prompt_alignment': 'mean'
-        }).round(2)
-
-        for step in worst_by_step.index:
-            stats = worst_by_step.loc[step]
-            total_step_images = len(self.summary_df[self.summary_df['step'] == step])
-            percentage = (stats['uid'] / total_step_images) * 100
-            print(f"  {step}: {int(stats['uid'])} worst images ({percentage:.1f}% of step's images)")
-            print(f"    Avg Cultural Rep: {stats['cultural_representative']:.2f}")
-            print(f"    Avg Prompt Alignment: {stats['prompt_alignment']:.2f}")
+        self._print_kind_breakdown(self._kind_breakdown(self._worst_df, 'step'), self._total_by_step, 'worst', 'step')
+
+    def _kind_breakdown(self, images, key):
+        """Count and average quality scores of the given best or worst images per key value"""
+        return images.groupby(key, observed=True).agg(
+            count=('uid', 'count'),
+            avg_cultural_rep=('cultural_representative', 'mean'),
+            avg_prompt_align=('prompt_alignment', 'mean')
+        ).round(2)
+
+    def _print_kind_breakdown(self, stats, totals, kind, axis):
+        """Print image counts, share of the axis value's images and average scores"""
+        counts = stats['count'].to_numpy()
+        percentages = counts / totals.reindex(stats.index).to_numpy() * 100
+        lines = [
+            f"  {name}: {int(count)} {kind} images ({percentage:.1f}% of {axis}'s images)\n"
+            f"    Avg Cultural Rep: {cultural_rep:.2f}\n"
+            f"    Avg Prompt Alignment: {prompt_align:.2f}"
+            for name, count, percentage, cultural_rep, prompt_align in zip(
+                stats.index, counts, percentages,
+                stats['avg_cultural_rep'].to_numpy(), stats['avg_prompt_align'].to_numpy())
+        ]
+        # Emit the whole block with a single print call
+        if lines:
+            print('\n'.join(lines))
 
     def analyze_cultural_bias(self):
         """Analyze potential cultural bias in the model"""
@@ -311,47 +533,71 @@ class CulturalMetricsAnalyzer:
         print("=" * 60)
 
         # Compare performance across countries for same categories
-        bias_analysis = []
-
-        for category in self.summary_df['category'].unique():
-            for sub_category in self.summary_df['sub_category'].unique():
-                for variant in self.summary_df['variant'].unique():
-                    subset = self.summary_df[
-                        (self.summary_df['category'] == category) &
-                        (self.summary_df['sub_category'] == sub_category) &
-                        (self.summary_df['variant'] == variant)
-                    ]
-
-                    if len(subset) > 1:  # Only analyze if multiple countries have this combination
-                        country_performance = subset.groupby('country')['f1'].mean()
-                        if len(country_performance) > 1:
-                            max_perf = country_performance.max()
-                            min_perf = country_performance.min()
-                            performance_gap = max_perf - min_perf
-
-                            bias_analysis.append({
-                                'category': category,
-                                'sub_category': sub_category,
-                                'variant': variant,
-                                'performance_gap': performance_gap,
-                                'best_country': country_performance.idxmax(),
-                                'worst_country': country_performance.idxmin(),
-                                'best_score': max_perf,
-                                'worst_score': min_perf
-                            })
-
-        if bias_analysis:
-            bias_df = pd.DataFrame(bias_analysis)
-            bias_df = bias_df.sort_values('performance_gap', ascending=False)
+        cells, country_means = self._country_f1_by_cell()
+
+        # Only analyze combinations that multiple countries have
+        multi_country = np.count_nonzero(~np.isnan(country_means), axis=1) > 1
+        cells, country_means = cells[multi_country], country_means[multi_country]
+
+        if len(cells) > 0:
+            countries = self._country_cats
+            gaps = np.nanmax(country_means, axis=1) - np.nanmin(country_means, axis=1)
+
+            # Rank on the gap array and only label the ten widest cells; the same
+            # sort as a row-per-cell frame so tied gaps keep the report's order
+            top = pd.Series(gaps).sort_values(ascending=False).index[:10].to_numpy()
+            top_means = country_means[top]
+            best_idx = np.nanargmax(top_means, axis=1)
+            worst_idx = np.nanargmin(top_means, axis=1)
+            rows = np.arange(len(top))
+
+            bias_df = cells.iloc[top].assign(
+                performance_gap=gaps[top],
+                best_country=countries[best_idx],
+                worst_country=countries[worst_idx],
+                best_score=top_means[rows, best_idx],
+                worst_score=top_means[rows, worst_idx]
+            )
 
             print(f"\nLargest Performance Gaps Between Countries:")
             print(f"(Indicating potential cultural bias)")
 
-            for idx, row in bias_df.head(10).iterrows():
-                print(f"\n{row['category']}/{row['sub_category']}/{row['variant']}:")
-                print(f"  Gap: {row['performance_gap']:.3f}")
-                print(f"  Best: {row['best_country']} (F1: {row['best_score']:.3f})")
-                print(f"  Worst: {row['worst_country']} (F1: {row['worst_score']:.3f})")
+            for row in bias_df.itertuples(index=False):
+                print(f"\n{row.category}/{row.sub_category}/{row.variant}:")
+                print(f"  Gap: {row.performance_gap:.3f}")
+                print(f"  Best: {row.best_country} (F1: {row.best_score:.3f})")
+                print(f"  Worst: {row.worst_country} (F1: {row.worst_score:.3f})")
+
+    def _country_f1_by_cell(self):
+        """Mean F1 per (category, sub_category, variant) cell and country, reduced on categorical codes"""
+        df = self.summary_df
+        keys = [_appearance_codes(df[col]) for col in ['category', 'sub_category', 'variant']]
+        (cat_codes, cat_labels), (sub_codes, sub_labels), (var_codes, var_labels) = keys
+        n_sub, n_var = len(sub_labels), len(var_labels)
+        n_countries = len(df['country'].cat.categories)
+
+        # One integer key per cell; np.unique keeps only observed cells, ordered by first
+        # appearance of each label so ties rank as in a row-order scan
+        cell_codes = (cat_codes * n_sub + sub_codes) * n_var + var_codes
+        cell_ids, cell_idx = np.unique(cell_codes, return_inverse=True)
+
+        f1 = df['f1'].to_numpy(dtype=np.float64)
+        valid = ~np.isnan(f1)
+        flat_idx = cell_idx[valid] * n_countries + df['country'].cat.codes.to_numpy()[valid]
+        size = len(cell_ids) * n_countries
+        sums = np.bincount(flat_idx, weights=f1[valid], minlength=size).reshape(-1, n_countries)
+        counts = np.bincount(flat_idx, minlength=size).reshape(-1, n_countries)
+        with np.errstate(invalid='ignore'):
+            country_means = sums / counts
+
+        cat_ids, rest = np.divmod(cell_ids, n_sub * n_var)
+        sub_ids, var_ids = np.divmod(rest, n_var)
+        cells = pd.DataFrame({
+            'category': cat_labels[cat_ids],
+            'sub_category': sub_labels[sub_ids],
+            'variant': var_labels[var_ids]
+        })
+        return cells, country_means
 
     def create_visualizations(self):
         """Create comprehensive visualizations for cultural metrics"""
@@ -359,57 +605,51 @@ class CulturalMetricsAnalyzer:
         print("GENERATING VISUALIZATIONS")
         print("=" * 60)
 
-        # 1. Country Performance Heatmap
-        self._plot_country_performance_heatmap()
-
-        # 2. Category Performance by Country
-        self._plot_category_performance_by_country()
-
-        # 3. Step Performance Analysis
-        self._plot_step_performance()
-
-        # 4. Variant Performance Comparison
-        self._plot_variant_performance()
-
-        # 5. Processing Time Analysis
-        self._plot_processing_time_analysis()
-
-        # 6. Image Quality Analysis
-        self._plot_image_quality_analysis()
-
-        # 7. Best/Worst Distribution
-        self._plot_best_worst_distribution()
-
-        # 8. Cultural Representative vs Prompt Alignment
-        self._plot_cultural_vs_prompt_alignment()
-
-        # 9. Advanced Heatmaps for Country-Step Analysis
-        self._plot_advanced_country_step_heatmaps()
-
-        # 10. Comprehensive Performance Comparison Heatmaps
-        self._plot_comprehensive_performance_heatmaps()
+        plot_methods = [
+            '_plot_country_performance_heatmap',         # 1. Country Performance Heatmap
+            '_plot_category_performance_by_country',     # 2. Category Performance by Country
+            '_plot_step_performance',                    # 3. Step Performance Analysis
+            '_plot_variant_performance',                 # 4. Variant Performance Comparison
+            '_plot_processing_time_analysis',            # 5. Processing Time Analysis
+            '_plot_image_quality_analysis',              # 6. Image Quality Analysis
+            '_plot_best_worst_distribution',             # 7. Best/Worst Distribution
+            '_plot_cultural_vs_prompt_alignment',        # 8. Cultural Representative vs Prompt Alignment
+            # 9. Advanced Heatmaps for Country-Step Analysis
+            '_plot_country_step_quality_heatmaps',
+            '_plot_processing_vlm_heatmaps',
+            # 10. Comprehensive Performance Comparison Heatmaps
+            '_plot_category_country_step_heatmaps',
+            '_plot_variant_comparison_heatmaps',
+            '_plot_step_progression_heatmaps',
+        ]
+
+        # Each task writes its own PNG, so render them in worker processes that
+        # receive the analyzer once; their output is printed here in chart order
+        with ProcessPoolExecutor(max_workers=min(len(plot_methods), MAX_WORKERS),
+                                 initializer=_init_plot_worker, initargs=(self,)) as executor:
+            for output in executor.map(_run_plot, plot_methods):
+                print(output, end='')
 
         print(f"\nAll visualizations saved to: {self.charts_dir}")
 
     def _plot_country_performance_heatmap(self):
         """Create a heatmap of performance metrics by country"""
-        fig, axes = plt.subplots(2, 2, figsize=(15, 12))
+        fig = get_plot_figure((15, 12))
+        axes = fig.subplots(2, 2)
         fig.suptitle('Cultural Performance Heatmap by Country', fontsize=16, fontweight='bold')
 
         metrics = ['accuracy', 'precision', 'recall', 'f1']
 
+        # Average all metrics in one pass; each subplot pivots out its own column
+        metric_means = self.summary_df.groupby(['country', 'category_variant'], observed=True)[metrics].mean()
+
         for idx, metric in enumerate(metrics):
             ax = axes[idx // 2, idx % 2]
 
             # Create pivot table for heatmap
-            pivot_data = self.summary_df.pivot_table(
-                values=metric,
-                index='country',
-                columns='category_variant',
-                aggfunc='mean'
-            )
+            pivot_data = metric_means[metric].unstack('category_variant')
 
-            sns.heatmap(pivot_data, annot=True, fmt='.2f', cmap='RdYlBu_r',
+            sns.heatmap(pivot_data, annot=pivot_data.size <= ANNOT_MAX_CELLS, fmt='.2f', cmap='RdYlBu_r',
                        ax=ax, cbar_kws={'label': metric.title()})
             ax.set_title(f'{metric.title()} by Country and Category')
             ax.set_xlabel('Category_SubCategory_Variant')
@@ -418,40 +658,50 @@ class CulturalMetricsAnalyzer:
             # Rotate x-axis labels for better readability
             ax.tick_params(axis='x', rotation=45)
 
-        plt.tight_layout()
+        fig.tight_layout()
         save_path = os.path.join(self.charts_dir, "country_performance_heatmap.png")
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.savefig(save_path, **SAVE_KW)
         print(f"Generated: {save_path}")
 
     def _plot_category_performance_by_country(self):
         """Plot performance by category for each country"""
-        fig, axes = plt.subplots(2, 2, figsize=(16, 12))
+        fig = get_plot_figure((16, 12))
+        axes = fig.subplots(2, 2)
         fig.suptitle('Performance by Category and Country', fontsize=16, fontweight='bold')
 
         metrics = ['accuracy', 'precision', 'recall', 'f1']
 
+        # Average all metrics in one pass and share the result across subplots
+        category_country_data = self.summary_df.groupby(['category', 'country'], observed=True)[metrics].mean()
+        categories = category_country_data.index.unique('category')
+        countries = category_country_data.index.unique('country')
+        colors = [sns.desaturate(color, 0.75) for color in sns.color_palette(n_colors=len(countries))]
+        x = np.arange(len(categories))
+        width = 0.8 / len(countries)
+
         for idx, metric in enumerate(metrics):
             ax = axes[idx // 2, idx % 2]
 
-            # Create grouped bar plot
-            category_country_data = self.summary_df.groupby(['category', 'country'])[metric].mean().reset_index()
-
-            sns.barplot(data=category_country_data, x='category', y=metric, hue='country', ax=ax)
+            # Create grouped bar plot, one dodged bar per country within each category
+            metric_data = category_country_data[metric].unstack('country').reindex(index=categories, columns=countries)
+            for i, country in enumerate(countries):
+                ax.bar(x - 0.4 + (i + 0.5) * width, metric_data[country].to_numpy(), width,
+                       label=country, color=colors[i])
+            ax.set_xticks(x, categories)
             ax.set_title(f'{metric.title()} by Category and Country')
             ax.set_xlabel('Category')
             ax.set_ylabel(metric.title())
             ax.legend(title='Country', bbox_to_anchor=(1.05, 1), loc='upper left')
 
-        plt.tight_layout()
+        fig.tight_layout()
         save_path = os.path.join(self.charts_dir, "category_performance_by_country.png")
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.savefig(save_path, **SAVE_KW)
         print(f"Generated: {save_path}")
 
     def _plot_step_performance(self):
         """Plot performance across different steps"""
-        fig, axes = plt.subplots(2, 2, figsize=(15, 10))
+        fig = get_plot_figure((15, 10))
+        axes = fig.subplots(2, 2)
         fig.suptitle('Performance Across Steps', fontsize=16, fontweight='bold')
 
         metrics = ['accuracy', 'precision', 'recall', 'f1']
@@ -468,19 +718,19 @@ class CulturalMetricsAnalyzer:
             ax.set_ylabel(metric.title())
 
             # Add mean line
-            step_means = step_data.groupby('step_num')[metric].mean()
+            step_means = step_data.groupby('step_num', observed=True)[metric].mean()
             ax.plot(range(len(step_means)), step_means.values, 'ro-', alpha=0.7, label='Mean')
             ax.legend()
 
-        plt.tight_layout()
+        fig.tight_layout()
         save_path = os.path.join(self.charts_dir, "step_performance.png")
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.savefig(save_path, **SAVE_KW)
         print(f"Generated: {save_path}")
 
     def _plot_variant_performance(self):
         """Plot performance by variant (traditional, modern, general)"""
-        fig, axes = plt.subplots(2, 2, figsize=(12, 10))
+        fig = get_plot_figure((12, 10))
+        axes = fig.subplots(2, 2)
         fig.suptitle('Performance by Variant Type', fontsize=16, fontweight='bold')
 
         metrics = ['accuracy', 'precision', 'recall', 'f1']
@@ -488,97 +738,98 @@ class CulturalMetricsAnalyzer:
         for idx, metric in enumerate(metrics):
             ax = axes[idx // 2, idx % 2]
 
-            # Violin plot showing distribution by variant
-            sns.violinplot(data=self.summary_df, x='variant', y=metric, ax=ax)
+            # Violin plot showing distribution by variant, with median and quartile lines
+            labels, groups = self._grouped_values('variant', metric)
+            ax.violinplot(groups, showmedians=True, quantiles=[[0.25, 0.75]] * len(groups))
+            ax.set_xticks(np.arange(1, len(labels) + 1), labels)
             ax.set_title(f'{metric.title()} by Variant')
             ax.set_xlabel('Variant')
             ax.set_ylabel(metric.title())
 
-        plt.tight_layout()
+        fig.tight_layout()
         save_path = os.path.join(self.charts_dir, "variant_performance.png")
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.savefig(save_path, **SAVE_KW)
         print(f"Generated: {save_path}")
 
     def _plot_processing_time_analysis(self):
         """Analyze processing time patterns"""
-        fig, axes = plt.subplots(1, 3, figsize=(18, 6))
+        fig = get_plot_figure((18, 6))
+        axes = fig.subplots(1, 3)
         fig.suptitle('Processing Time Analysis', fontsize=16, fontweight='bold')
 
         # Processing time by country
-        sns.boxplot(data=self.summary_df, x='country', y='processing_time', ax=axes[0])
+        self._draw_boxplot(axes[0], 'country', 'processing_time')
         axes[0].set_title('Processing Time by Country')
         axes[0].set_xlabel('Country')
         axes[0].set_ylabel('Processing Time (seconds)')
         axes[0].tick_params(axis='x', rotation=45)
 
         # Processing time by category
-        sns.boxplot(data=self.summary_df, x='category', y='processing_time', ax=axes[1])
+        self._draw_boxplot(axes[1], 'category', 'processing_time')
         axes[1].set_title('Processing Time by Category')
         axes[1].set_xlabel('Category')
         axes[1].set_ylabel('Processing Time (seconds)')
 
         # Processing time vs F1 score
-        sns.scatterplot(data=self.summary_df, x='processing_time', y='f1',
-                       hue='country', alpha=0.7, ax=axes[2])
+        self._draw_country_scatter(axes[2], self.summary_df, 'processing_time', 'f1', alpha=0.7,
+                                   title=None, bbox_to_anchor=(1.05, 1), loc='upper left')
         axes[2].set_title('Processing Time vs F1 Score')
         axes[2].set_xlabel('Processing Time (seconds)')
         axes[2].set_ylabel('F1 Score')
-        axes[2].legend(bbox_to_anchor=(1.05, 1), loc='upper left')
 
-        plt.tight_layout()
+        fig.tight_layout()
         save_path = os.path.join(self.charts_dir, "processing_time_analysis.png")
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.savefig(save_path, **SAVE_KW)
         print(f"Generated: {save_path}")
 
     def _plot_image_quality_analysis(self):
         """Plot image quality metrics analysis"""
-        fig, axes = plt.subplots(2, 2, figsize=(16, 12))
+        fig = get_plot_figure((16, 12))
+        axes = fig.subplots(2, 2)
         fig.suptitle('Image Quality Metrics Analysis', fontsize=16, fontweight='bold')
 
         # Cultural representative by country
-        sns.boxplot(data=self.summary_df, x='country', y='cultural_representative', ax=axes[0, 0])
+        self._draw_boxplot(axes[0, 0], 'country', 'cultural_representative')
         axes[0, 0].set_title('Cultural Representative Score by Country')
         axes[0, 0].set_xlabel('Country')
         axes[0, 0].set_ylabel('Cultural Representative Score')
         axes[0, 0].tick_params(axis='x', rotation=45)
 
         # Prompt alignment by country
-        sns.boxplot(data=self.summary_df, x='country', y='prompt_alignment', ax=axes[0, 1])
+        self._draw_boxplot(axes[0, 1], 'country', 'prompt_alignment')
         axes[0, 1].set_title('Prompt Alignment Score by Country')
         axes[0, 1].set_xlabel('Country')
         axes[0, 1].set_ylabel('Prompt Alignment Score')
         axes[0, 1].tick_params(axis='x', rotation=45)
 
         # Cultural representative by category
-        sns.boxplot(data=self.summary_df, x='category', y='cultural_representative', ax=axes[1, 0])
+        self._draw_boxplot(axes[1, 0], 'category', 'cultural_representative')
         axes[1, 0].set_title('Cultural Representative Score by Category')
         axes[1, 0].set_xlabel('Category')
         axes[1, 0].set_ylabel('Cultural Representative Score')
         axes[1, 0].tick_params(axis='x', rotation=45)
 
         # Prompt alignment by category
-        sns.boxplot(data=self.summary_df, x='category', y='prompt_alignment', ax=axes[1, 1])
+        self._draw_boxplot(axes[1, 1], 'category', 'prompt_alignment')
         axes[1, 1].set_title('Prompt Alignment Score by Category')
         axes[1, 1].set_xlabel('Category')
         axes[1, 1].set_ylabel('Prompt Alignment Score')
         axes[1, 1].tick_params(axis='x', rotation=45)
 
-        plt.tight_layout()
+        fig.tight_layout()
         save_path = os.path.join(self.charts_dir, "image_quality_analysis.png")
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.savefig(save_path, **SAVE_KW)
         print(f"Generated: {save_path}")
 
     def _plot_best_worst_distribution(self):
         """Plot best/worst image distribution"""
-        fig, axes = plt.subplots(2, 2, figsize=(16, 12))
+        fig = get_plot_figure((16, 12))
+        axes = fig.subplots(2, 2)
         fig.suptitle('Best/Worst Image Distribution Analysis', fontsize=16, fontweight='bold')
 
         # Best images by country
-        best_by_country = self.summary_df[self.summary_df['is_best'] == True].groupby('country').size()
-        total_by_country = self.summary_df.groupby('country').size()
+        best_by_country = self._best_df.groupby('country', observed=True).size()
+        total_by_country = self._total_by_country
         best_percentage = (best_by_country / total_by_country * 100).fillna(0)
 
         best_percentage.plot(kind='bar', ax=axes[0, 0], color='green', alpha=0.7)
@@ -588,7 +839,7 @@ class CulturalMetricsAnalyzer:
         axes[0, 0].tick_params(axis='x', rotation=45)
 
         # Worst images by country
-        worst_by_country = self.summary_df[self.summary_df['is_worst'] == True].groupby('country').size()
+        worst_by_country = self._worst_df.groupby('country', observed=True).size()
         worst_percentage = (worst_by_country / total_by_country * 100).fillna(0)
 
         worst_percentage.plot(kind='bar', ax=axes[0, 1], color='red', alpha=0.7)
@@ -598,8 +849,8 @@ class CulturalMetricsAnalyzer:
         axes[0, 1].tick_params(axis='x', rotation=45)
 
         # Best images by step
-        best_by_step = self.summary_df[self.summary_df['is_best'] == True].groupby('step').size()
-        total_by_step = self.summary_df.groupby('step').size()
+        best_by_step = self._best_df.groupby('step', observed=True).size()
+        total_by_step = self._total_by_step
         best_step_percentage = (best_by_step / total_by_step * 100).fillna(0)
 
         best_step_percentage.plot(kind='bar', ax=axes[1, 0], color='green', alpha=0.7)
@@ -609,7 +860,7 @@ class CulturalMetricsAnalyzer:
         axes[1, 0].tick_params(axis='x', rotation=45)
 
         # Worst images by step
-        worst_by_step = self.summary_df[self.summary_df['is_worst'] == True].groupby('step').size()
+        worst_by_step = self._worst_df.groupby('step', observed=True).size()
         worst_step_percentage = (worst_by_step / total_by_step * 100).fillna(0)
 
         worst_step_percentage.plot(kind='bar', ax=axes[1, 1], color='red', alpha=0.7)
@@ -618,349 +869,276 @@ class CulturalMetricsAnalyzer:
         axes[1, 1].set_ylabel('Percentage of Worst Images (%)')
         axes[1, 1].tick_params(axis='x', rotation=45)
 
-        plt.tight_layout()
+        fig.tight_layout()
         save_path = os.path.join(self.charts_dir, "best_worst_distribution.png")
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.savefig(save_path, **SAVE_KW)
         print(f"Generated: {save_path}")
 
     def _plot_cultural_vs_prompt_alignment(self):
         """Plot cultural representative vs prompt alignment correlation"""
-        fig, axes = plt.subplots(1, 3, figsize=(18, 6))
+        fig = get_plot_figure((18, 6))
+        axes = fig.subplots(1, 3)
         fig.suptitle('Cultural Representative vs Prompt Alignment Analysis', fontsize=16, fontweight='bold')
 
         # Scatter plot: Cultural Rep vs Prompt Alignment
-        sns.scatterplot(data=self.summary_df, x='cultural_representative', y='prompt_alignment',
-                       hue='country', alpha=0.6, ax=axes[0])
+        self._draw_country_scatter(axes[0], self.summary_df, 'cultural_representative', 'prompt_alignment',
+                                   alpha=0.6)
         axes[0].set_title('Cultural Rep vs Prompt Alignment by Country')
         axes[0].set_xlabel('Cultural Representative Score')
         axes[0].set_ylabel('Prompt Alignment Score')
 
         # Best images: Cultural Rep vs Prompt Alignment
-        best_images = self.summary_df[self.summary_df['is_best'] == True]
+        best_images = self._best_df
         if len(best_images) > 0:
-            sns.scatterplot(data=best_images, x='cultural_representative', y='prompt_alignment',
-                           hue='country', alpha=0.8, ax=axes[1], s=100)
+            self._draw_country_scatter(axes[1], best_images, 'cultural_representative', 'prompt_alignment',
+                                       alpha=0.8, s=100)
             axes[1].set_title('Best Images: Cultural Rep vs Prompt Alignment')
             axes[1].set_xlabel('Cultural Representative Score')
             axes[1].set_ylabel('Prompt Alignment Score')
 
         # Worst images: Cultural Rep vs Prompt Alignment
-        worst_images = self.summary_df[self.summary_df['is_worst'] == True]
+        worst_images = self._worst_df
         if len(worst_images) > 0:
-            sns.scatterplot(data=worst_images, x='cultural_representative', y='prompt_alignment',
-                           hue='country', alpha=0.8, ax=axes[2], s=100)
+            self._draw_country_scatter(axes[2], worst_images, 'cultural_representative', 'prompt_alignment',
+                                       alpha=0.8, s=100)
             axes[2].set_title('Worst Images: Cultural Rep vs Prompt Alignment')
             axes[2].set_xlabel('Cultural Representative Score')
             axes[2].set_ylabel('Prompt Alignment Score')
 
-        plt.tight_layout()
+        fig.tight_layout()
         save_path = os.path.join(self.charts_dir, "cultural_vs_prompt_alignment.png")
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.savefig(save_path, **SAVE_KW)
         print(f"Generated: {save_path}")
 
-    def _plot_advanced_country_step_heatmaps(self):
-        """Create advanced heatmaps focusing on country-step performance analysis"""
+    def _plot_country_step_quality_heatmaps(self):
+        """Create country-step heatmaps of image quality scores and best/worst shares"""
+        grid = self._country_step_grid
+        if grid.empty:
+            return
 
-        # 1. Country-Step Performance Heatmap (Image Quality Metrics)
-        fig, axes = plt.subplots(2, 2, figsize=(18, 14))
+        fig = get_plot_figure((18, 14))
+        axes = fig.subplots(2, 2)
         fig.suptitle('Country-Step Performance Analysis (Image Quality Metrics)', fontsize=16, fontweight='bold')
 
         # Cultural Representative Score by Country-Step
-        cultural_pivot = self.summary_df.pivot_table(
-            values='cultural_representative',
-            index='country',
-            columns='step',
-            aggfunc='mean'
-        )
+        cultural_pivot = grid['cultural']
 
-        sns.heatmap(cultural_pivot, annot=True, fmt='.2f', cmap='RdYlGn',
-                   ax=axes[0, 0], cbar_kws={'label': 'Cultural Representative Score'})
+        self._draw_heatmap(axes[0, 0], cultural_pivot, fmt='.2f', cmap='RdYlGn', label='Cultural Representative Score')
         axes[0, 0].set_title('Cultural Representative Score by Country & Step')
         axes[0, 0].set_xlabel('Step')
         axes[0, 0].set_ylabel('Country')
 
         # Prompt Alignment Score by Country-Step
-        alignment_pivot = self.summary_df.pivot_table(
-            values='prompt_alignment',
-            index='country',
-            columns='step',
-            aggfunc='mean'
-        )
+        alignment_pivot = grid['alignment']
 
-        sns.heatmap(alignment_pivot, annot=True, fmt='.2f', cmap='RdYlGn',
-                   ax=axes[0, 1], cbar_kws={'label': 'Prompt Alignment Score'})
+        self._draw_heatmap(axes[0, 1], alignment_pivot, fmt='.2f', cmap='RdYlGn', label='Prompt Alignment Score')
         axes[0, 1].set_title('Prompt Alignment Score by Country & Step')
         axes[0, 1].set_xlabel('Step')
         axes[0, 1].set_ylabel('Country')
 
         # Best Image Percentage by Country-Step
-        best_pivot = self.summary_df.groupby(['country', 'step']).agg({
-            'is_best': ['sum', 'count']
-        })
-        best_pivot.columns = ['best_count', 'total_count']
-        best_pivot['best_percentage'] = (best_pivot['best_count'] / best_pivot['total_count'] * 100)
-        best_percentage_pivot = best_pivot['best_percentage'].unstack(fill_value=0)
+        best_percentage_pivot = grid['best'].mul(100).fillna(0)
 
-        sns.heatmap(best_percentage_pivot, annot=True, fmt='.1f', cmap='Greens',
-                   ax=axes[1, 0], cbar_kws={'label': 'Best Images (%)'})
+        self._draw_heatmap(axes[1, 0], best_percentage_pivot, fmt='.1f', cmap='Greens', label='Best Images (%)')
         axes[1, 0].set_title('Best Images Percentage by Country & Step')
         axes[1, 0].set_xlabel('Step')
         axes[1, 0].set_ylabel('Country')
 
         # Worst Image Percentage by Country-Step
-        worst_pivot = self.summary_df.groupby(['country', 'step']).agg({
-            'is_worst': ['sum', 'count']
-        })
-        worst_pivot.columns = ['worst_count', 'total_count']
-        worst_pivot['worst_percentage'] = (worst_pivot['worst_count'] / worst_pivot['total_count'] * 100)
-        worst_percentage_pivot = worst_pivot['worst_percentage'].unstack(fill_value=0)
+        worst_percentage_pivot = grid['worst'].mul(100).fillna(0)
 
-        sns.heatmap(worst_percentage_pivot, annot=True, fmt='.1f', cmap='Reds',
-                   ax=axes[1, 1], cbar_kws={'label': 'Worst Images (%)'})
+        self._draw_heatmap(axes[1, 1], worst_percentage_pivot, fmt='.1f', cmap='Reds', label='Worst Images (%)')
         axes[1, 1].set_title('Worst Images Percentage by Country & Step')
         axes[1, 1].set_xlabel('Step')
         axes[1, 1].set_ylabel('Country')
 
-        plt.tight_layout()
+        fig.tight_layout()
         save_path = os.path.join(self.charts_dir, "advanced_country_step_heatmaps.png")
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.savefig(save_path, **SAVE_KW)
         print(f"Generated: {save_path}")
 
-        # 2. Processing Time & VLM Performance by Country-Step
-        fig, axes = plt.subplots(2, 2, figsize=(18, 14))
+    def _plot_processing_vlm_heatmaps(self):
+        """Create country-step heatmaps of processing time and VLM performance"""
+        grid = self._country_step_grid
+        if grid.empty:
+            return
+
+        fig = get_plot_figure((18, 14))
+        axes = fig.subplots(2, 2)
         fig.suptitle('Processing Time & VLM Performance by Country-Step', fontsize=16, fontweight='bold')
 
         # Processing Time by Country-Step
-        time_pivot = self.summary_df.pivot_table(
-            values='processing_time',
-            index='country',
-            columns='step',
-            aggfunc='mean'
-        )
+        time_pivot = grid['processing']
 
-        sns.heatmap(time_pivot, annot=True, fmt='.2f', cmap='YlOrRd',
-                   ax=axes[0, 0], cbar_kws={'label': 'Processing Time (seconds)'})
+        self._draw_heatmap(axes[0, 0], time_pivot, fmt='.2f', cmap='YlOrRd', label='Processing Time (seconds)')
         axes[0, 0].set_title('Average Processing Time by Country & Step')
         axes[0, 0].set_xlabel('Step')
         axes[0, 0].set_ylabel('Country')
 
         # F1 Score by Country-Step
-        f1_pivot = self.summary_df.pivot_table(
-            values='f1',
-            index='country',
-            columns='step',
-            aggfunc='mean'
-        )
+        f1_pivot = grid['f1']
 
-        sns.heatmap(f1_pivot, annot=True, fmt='.3f', cmap='RdYlBu_r',
-                   ax=axes[0, 1], cbar_kws={'label': 'F1 Score'})
+        self._draw_heatmap(axes[0, 1], f1_pivot, fmt='.3f', cmap='RdYlBu_r', label='F1 Score')
         axes[0, 1].set_title('Average F1 Score by Country & Step')
         axes[0, 1].set_xlabel('Step')
         axes[0, 1].set_ylabel('Country')
 
         # Accuracy by Country-Step
-        accuracy_pivot = self.summary_df.pivot_table(
-            values='accuracy',
-            index='country',
-            columns='step',
-            aggfunc='mean'
-        )
+        accuracy_pivot = grid['accuracy']
 
-        sns.heatmap(accuracy_pivot, annot=True, fmt='.3f', cmap='RdYlBu_r',
-                   ax=axes[1, 0], cbar_kws={'label': 'Accuracy'})
+        self._draw_heatmap(axes[1, 0], accuracy_pivot, fmt='.3f', cmap='RdYlBu_r', label='Accuracy')
         axes[1, 0].set_title('Average Accuracy by Country & Step')
         axes[1, 0].set_xlabel('Step')
         axes[1, 0].set_ylabel('Country')
 
         # Combined Quality Score (Cultural Rep + Prompt Alignment)
-        self.summary_df['combined_quality'] = (self.summary_df['cultural_representative'] +
-                                              self.summary_df['prompt_alignment']) / 2
-
-        combined_pivot = self.summary_df.pivot_table(
-            values='combined_quality',
-            index='country',
-            columns='step',
-            aggfunc='mean'
-        )
+        combined_pivot = grid['combined']
 
-        sns.heatmap(combined_pivot, annot=True, fmt='.2f', cmap='RdYlGn',
-                   ax=axes[1, 1], cbar_kws={'label': 'Combined Quality Score'})
+        self._draw_heatmap(axes[1, 1], combined_pivot, fmt='.2f', cmap='RdYlGn', label='Combined Quality Score')
         axes[1, 1].set_title('Combined Quality Score by Country & Step')
         axes[1, 1].set_xlabel('Step')
         axes[1, 1].set_ylabel('Country')
 
-        plt.tight_layout()
+        fig.tight_layout()
         save_path = os.path.join(self.charts_dir, "processing_vlm_performance_heatmaps.png")
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.savefig(save_path, **SAVE_KW)
         print(f"Generated: {save_path}")
 
-    def _plot_comprehensive_performance_heatmaps(self):
-        """Create comprehensive performance comparison heatmaps"""
-
-        # 1. Category-Country-Step Analysis
-        fig, axes = plt.subplots(2, 3, figsize=(24, 16))
+    def _plot_category_country_step_heatmaps(self):
+        """Create country-step heatmaps for the top categories"""
+        fig = get_plot_figure((24, 16))
+        axes = fig.subplots(2, 3)
         fig.suptitle('Comprehensive Performance Analysis by Category, Country & Step', fontsize=18, fontweight='bold')
 
         # Top categories for detailed analysis
         top_categories = ['food', 'fashion', 'event']  # Categories with most data
 
+        # Group once by category/country/step and slice each category's heatmaps
+        category_means = self.summary_df.groupby(['category', 'country', 'step'], observed=True)[
+            ['cultural_representative', 'f1']].mean()
+        present_categories = category_means.index.unique('category')
+
         for idx, category in enumerate(top_categories):
-            category_data = self.summary_df[self.summary_df['category'] == category]
+            category_data = category_means.loc[category] if category in present_categories else None
 
             # Cultural Representative by Country-Step for this category
-            cat_cultural_pivot = category_data.pivot_table(
-                values='cultural_representative',
-                index='country',
-                columns='step',
-                aggfunc='mean'
-            )
+            cat_cultural_pivot = category_data['cultural_representative'].unstack('step') if category_data is not None else None
+
+            # Missing categories, or ones covering a single country or step, get no heatmaps
+            if cat_cultural_pivot is None or min(cat_cultural_pivot.shape) < 2:
+                axes[0, idx].set_visible(False)
+                axes[1, idx].set_visible(False)
+                continue
 
-            sns.heatmap(cat_cultural_pivot, annot=True, fmt='.2f', cmap='RdYlGn',
-                       ax=axes[0, idx], cbar_kws={'label': 'Cultural Rep Score'})
+            self._draw_heatmap(axes[0, idx], cat_cultural_pivot, fmt='.2f', cmap='RdYlGn', label='Cultural Rep Score')
             axes[0, idx].set_title(f'{category.title()} - Cultural Representative by Country & Step')
             axes[0, idx].set_xlabel('Step')
             axes[0, idx].set_ylabel('Country')
 
             # F1 Score by Country-Step for this category
-            cat_f1_pivot = category_data.pivot_table(
-                values='f1',
-                index='country',
-                columns='step',
-                aggfunc='mean'
-            )
+            cat_f1_pivot = category_data['f1'].unstack('step')
 
-            sns.heatmap(cat_f1_pivot, annot=True, fmt='.2f', cmap='RdYlBu_r',
-                       ax=axes[1, idx], cbar_kws={'label': 'F1 Score'})
+            self._draw_heatmap(axes[1, idx], cat_f1_pivot, fmt='.2f', cmap='RdYlBu_r', label='F1 Score')
             axes[1, idx].set_title(f'{category.title()} - F1 Score by Country & Step')
             axes[1, idx].set_xlabel('Step')
             axes[1, idx].set_ylabel('Country')
 
-        plt.tight_layout()
+        fig.tight_layout()
         save_path = os.path.join(self.charts_dir, "comprehensive_category_analysis_heatmaps.png")
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.savefig(save_path, **SAVE_KW)
         print(f"Generated: {save_path}")
 
-        # 2. Variant Performance Comparison
-        fig, axes = plt.subplots(2, 2, figsize=(20, 16))
+    def _plot_variant_comparison_heatmaps(self):
+        """Create country-step heatmaps per variant and the traditional/modern difference"""
+        fig = get_plot_figure((20, 16))
+        axes = fig.subplots(2, 2)
         fig.suptitle('Variant Performance Comparison by Country & Step', fontsize=16, fontweight='bold')
 
         # Traditional vs Modern vs General variants
         main_variants = ['traditional', 'modern', 'general']
 
+        # Group once by variant/country/step and slice each variant's heatmap
+        variant_means = self.summary_df.groupby(['variant', 'country', 'step'], observed=True)[
+            'cultural_representative'].mean()
+        present_variants = variant_means.index.unique('variant')
+
         for idx, variant in enumerate(main_variants):
             if idx >= 3:  # Only plot first 3 variants
                 break
 
-            variant_data = self.summary_df[self.summary_df['variant'] == variant]
-
-            if len(variant_data) == 0:
-                continue
+            row = idx // 2
+            col = idx % 2
 
             # Cultural Representative for this variant
-            var_cultural_pivot = variant_data.pivot_table(
-                values='cultural_representative',
-                index='country',
-                columns='step',
-                aggfunc='mean'
-            )
+            var_cultural_pivot = variant_means.loc[variant].unstack('step') if variant in present_variants else None
 
-            row = idx // 2
-            col = idx % 2
+            # Missing variants, or ones covering a single country or step, get no heatmap
+            if var_cultural_pivot is None or min(var_cultural_pivot.shape) < 2:
+                axes[row, col].set_visible(False)
+                continue
 
-            sns.heatmap(var_cultural_pivot, annot=True, fmt='.2f', cmap='RdYlGn',
-                       ax=axes[row, col], cbar_kws={'label': 'Cultural Rep Score'})
+            self._draw_heatmap(axes[row, col], var_cultural_pivot, fmt='.2f', cmap='RdYlGn', label='Cultural Rep Score')
             axes[row, col].set_title(f'{variant.title()} Variant - Cultural Rep by Country & Step')
             axes[row, col].set_xlabel('Step')
             axes[row, col].set_ylabel('Country')
 
         # Performance difference heatmap (Traditional - Modern)
-        if len(self.summary_df[self.summary_df['variant'] == 'traditional']) > 0 and \
-           len(self.summary_df[self.summary_df['variant'] == 'modern']) > 0:
+        diff_pivot = None
+        if 'traditional' in present_variants and 'modern' in present_variants:
 
-            trad_pivot = self.summary_df[self.summary_df['variant'] == 'traditional'].pivot_table(
-                values='cultural_representative', index='country', columns='step', aggfunc='mean'
-            )
-            mod_pivot = self.summary_df[self.summary_df['variant'] == 'modern'].pivot_table(
-                values='cultural_representative', index='country', columns='step', aggfunc='mean'
-            )
+            trad_pivot = variant_means.loc['traditional'].unstack('step')
+            mod_pivot = variant_means.loc['modern'].unstack('step')
 
             # Calculate difference (Traditional - Modern)
             diff_pivot = trad_pivot.subtract(mod_pivot, fill_value=0)
 
-            sns.heatmap(diff_pivot, annot=True, fmt='.2f', cmap='RdBu_r', center=0,
-                       ax=axes[1, 1], cbar_kws={'label': 'Difference (Trad - Mod)'})
+        # No difference panel without both variants or for a single country or step
+        if diff_pivot is None or min(diff_pivot.shape) < 2:
+            axes[1, 1].set_visible(False)
+        else:
+            self._draw_heatmap(axes[1, 1], diff_pivot, fmt='.2f', cmap='RdBu_r', label='Difference (Trad - Mod)', center=0)
             axes[1, 1].set_title('Traditional vs Modern Performance Difference')
             axes[1, 1].set_xlabel('Step')
             axes[1, 1].set_ylabel('Country')
 
-        plt.tight_layout()
+        fig.tight_layout()
         save_path = os.path.join(self.charts_dir, "variant_performance_comparison_heatmaps.png")
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.savefig(save_path, **SAVE_KW)
         print(f"Generated: {save_path}")
 
-        # 3. Step Progression Analysis
-        fig, axes = plt.subplots(1, 2, figsize=(20, 8))
+    def _plot_step_progression_heatmaps(self):
+        """Create step-to-step quality change and best/worst ratio heatmaps"""
+        fig = get_plot_figure((20, 8))
+        axes = fig.subplots(1, 2)
         fig.suptitle('Step Progression Analysis - Quality Changes Over Steps', fontsize=16, fontweight='bold')
 
-        # Calculate step-to-step changes in quality
-        step_changes = {}
-        for country in self.summary_df['country'].unique():
-            country_data = self.summary_df[self.summary_df['country'] == country]
-            step_means = country_data.groupby('step')['cultural_representative'].mean()
-
-            changes = []
-            steps = sorted([s for s in step_means.index if s != 'step0'])
-
-            for i, step in enumerate(steps):
-                if i == 0:
-                    # Compare with step0
-                    if 'step0' in step_means.index:
-                        change = step_means[step] - step_means['step0']
-                    else:
-                        change = 0
-                else:
-                    # Compare with previous step
-                    prev_step = steps[i-1]
-                    change = step_means[step] - step_means[prev_step]
-                changes.append(change)
-
-            step_changes[country] = changes
+        # Calculate step-to-step changes in quality: each step vs the previous one,
+        # and the first step vs step0 when the data has it
+        step_means = self._country_step_grid['cultural'].copy()
+        step0_means = step_means.pop('step0') if 'step0' in self._step_cats else None
 
         # Create DataFrame for heatmap
-        if step_changes:
-            changes_df = pd.DataFrame(step_changes, index=steps[:len(max(step_changes.values(), key=len))])
-            changes_df = changes_df.T  # Transpose to have countries as rows
+        if not step_means.empty:
+            changes_df = step_means.diff(axis=1)
+            changes_df.iloc[:, 0] = step_means.iloc[:, 0] - step0_means if step0_means is not None else 0
 
-            sns.heatmap(changes_df, annot=True, fmt='.3f', cmap='RdBu_r', center=0,
-                       ax=axes[0], cbar_kws={'label': 'Quality Change'})
+            self._draw_heatmap(axes[0], changes_df, fmt='.3f', cmap='RdBu_r', label='Quality Change', center=0)
             axes[0].set_title('Step-to-Step Quality Changes by Country')
             axes[0].set_xlabel('Step')
             axes[0].set_ylabel('Country')
 
         # Best vs Worst ratio by Country-Step
-        best_worst_ratio = self.summary_df.groupby(['country', 'step']).agg({
-            'is_best': 'sum',
-            'is_worst': 'sum'
-        })
-        best_worst_ratio['ratio'] = best_worst_ratio['is_best'] / (best_worst_ratio['is_worst'] + 1)  # +1 to avoid division by zero
-        ratio_pivot = best_worst_ratio['ratio'].unstack(fill_value=0)
+        grid = self._country_step_grid
+        ratio_pivot = (grid['best_count'] / (grid['worst_count'] + 1)).fillna(0)  # +1 to avoid division by zero
 
-        sns.heatmap(ratio_pivot, annot=True, fmt='.2f', cmap='RdYlGn',
-                   ax=axes[1], cbar_kws={'label': 'Best/Worst Ratio'})
+        self._draw_heatmap(axes[1], ratio_pivot, fmt='.2f', cmap='RdYlGn', label='Best/Worst Ratio')
         axes[1].set_title('Best/Worst Image Ratio by Country & Step')
         axes[1].set_xlabel('Step')
         axes[1].set_ylabel('Country')
 
-        plt.tight_layout()
+        fig.tight_layout()
         save_path = os.path.join(self.charts_dir, "step_progression_analysis_heatmaps.png")
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.savefig(save_path, **SAVE_KW)
         print(f"Generated: {save_path}")
 
     def generate_summary_report(self):
@@ -971,10 +1149,12 @@ class CulturalMetricsAnalyzer:
 
         # Key findings
         overall_f1 = self.summary_df['f1'].mean()
-        best_country = self.summary_df.groupby('country')['f1'].mean().idxmax()
-        worst_country = self.summary_df.groupby('country')['f1'].mean().idxmin()
-        best_category = self.summary_df.groupby('category')['f1'].mean().idxmax()
-        worst_category = self.summary_df.groupby('category')['f1'].mean().idxmin()
+
+        # Group each key once; the country mean/std also feed the recommendations
+        country_f1 = self.summary_df.groupby('country', observed=True, sort=False)['f1'].agg(['mean', 'std'])
+        category_f1 = self.summary_df.groupby('category', observed=True, sort=False)['f1'].mean()
+        best_country, worst_country = country_f1['mean'].idxmax(), country_f1['mean'].idxmin()
+        best_category, worst_category = category_f1.idxmax(), category_f1.idxmin()
 
         print(f"\nKEY FINDINGS:")
         print(f"- Overall F1 Score: {overall_f1:.3f}")
@@ -983,22 +1163,24 @@ class CulturalMetricsAnalyzer:
         print(f"- Best performing category: {best_category}")
         print(f"- Worst performing category: {worst_category}")
 
-        # Performance distribution
-        high_performers = len(self.summary_df[self.summary_df['f1'] > 0.8])
-        medium_performers = len(self.summary_df[(self.summary_df['f1'] >= 0.5) & (self.summary_df['f1'] <= 0.8)])
-        low_performers = len(self.summary_df[self.summary_df['f1'] < 0.5])
+        # Performance distribution, counted on the F1 array without masked copies
+        f1 = self.summary_df['f1'].to_numpy()
+        n = len(f1)
+        high_performers = int(np.count_nonzero(f1 > 0.8))
+        medium_performers = int(np.count_nonzero((f1 >= 0.5) & (f1 <= 0.8)))
+        low_performers = int(np.count_nonzero(f1 < 0.5))
 
         print(f"\nPERFORMANCE DISTRIBUTION:")
-        print(f"- High performers (F1 > 0.8): {high_performers} ({high_performers/len(self.summary_df)*100:.1f}%)")
-        print(f"- Medium performers (0.5 ≤ F1 ≤ 0.8): {medium_performers} ({medium_performers/len(self.summary_df)*100:.1f}%)")
-        print(f"- Low performers (F1 < 0.5): {low_performers} ({low_performers/len(self.summary_df)*100:.1f}%)")
+        print(f"- High performers (F1 > 0.8): {high_performers} ({high_performers/n*100:.1f}%)")
+        print(f"- Medium performers (0.5 ≤ F1 ≤ 0.8): {medium_performers} ({medium_performers/n*100:.1f}%)")
+        print(f"- Low performers (F1 < 0.5): {low_performers} ({low_performers/n*100:.1f}%)")
 
         print(f"\nRECOMMendations:")
-        if low_performers > len(self.summary_df) * 0.3:
+        if low_performers > n * 0.3:
             print("- High number of low performers detected. Consider model fine-tuning.")
-        if self.summary_df.groupby('country')['f1'].std().mean() > 0.2:
+        if country_f1['std'].mean() > 0.2:
             print("- Significant performance variation across countries. Address cultural bias.")
-        if self.summary_df.groupby('variant')['f1'].std().mean() > 0.2:
+        if self.summary_df.groupby('variant', observed=True, sort=False)['f1'].std().mean() > 0.2:
             print("- Performance varies significantly by variant. Focus on underperforming variants.")
 
         print(f"\n" + "=" * 80)
@@ -1021,8 +1203,17 @@ def main(model_name):
         print(f"Error: Cultural summary file not found at {cultural_summary_path}")
         return
 
+    # Aggregates are cached in a per-model results directory, away from the input
+    # data, and reused until either CSV changes
+    aggregate_cache_path = None
+    if HAS_PARQUET:
+        mtime = max(os.path.getmtime(cultural_metrics_path), os.path.getmtime(cultural_summary_path))
+        cache_dir = os.path.join(script_dir, '..', '..', 'results', 'cache', model_name)
+        aggregate_cache_path = os.path.join(cache_dir, f'.cache_country_step_{mtime:.0f}.parquet')
+
     # Initialize analyzer
-    analyzer = CulturalMetricsAnalyzer(cultural_metrics_path, cultural_summary_path, model_name)
+    analyzer = CulturalMetricsAnalyzer(cultural_metrics_path, cultural_summary_path, model_name,
+                                       aggregate_cache_path)
 
     # Run all analyses
     analyzer.analyze_overall_performance()
@@ -6,27 +6,154 @@ Analyzes general performance metrics for individual models.
 
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
 import os
+import io
+import contextlib
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from importlib.util import find_spec
 import re
+import sys
 
-# Set up plotting style
-plt.style.use('default')
-sns.set_palette("husl")
+# Shared analysis helpers live in scripts/core
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'core'))
+from prompt_labels import COUNTRY_KEYWORDS, CATEGORY_KEYWORDS, VARIANT_KEYWORDS, classify_prompts, label_order
+
+# Plotting modules are imported by load_plotting only when charts are drawn, so
+# running just the analyze_* reports skips matplotlib/seaborn's import cost
+plt = sns = cbook = Figure = None
+
+def load_plotting():
+    """Import matplotlib (Agg backend) and seaborn on first use and set up the plotting style"""
+    global plt, sns, cbook, Figure
+    if plt is not None:
+        return
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    from matplotlib import cbook
+    from matplotlib.figure import Figure
+
+    # Set up plotting style
+    plt.style.use('default')
+    sns.set_palette("husl")
+
+HAS_PYARROW = find_spec('pyarrow') is not None
+
+# PyArrow's multi-threaded CSV reader is used when available, else pandas' C parser
+CSV_ENGINE = 'pyarrow' if HAS_PYARROW else 'c'
+
+# Worker processes per pool; run_analysis.py sets ANALYSIS_WORKERS to this script's share
+# of the CPUs when it runs several analysis scripts at once
+MAX_WORKERS = int(os.environ.get('ANALYSIS_WORKERS', 0)) or os.cpu_count() or 1
+
+# Only the prompt, best steps and best scores of the summary are used; text columns
+# are read as Arrow-backed strings, scores as float32 NumPy columns (the CLIP scores
+# are exact in float32). Grouped stats tables are upcast before rounding so the
+# printed values match a float64 run.
+LABEL_DTYPE = 'string[pyarrow]' if CSV_ENGINE == 'pyarrow' else 'string'
+SUMMARY_DTYPES = {
+    'prompt': LABEL_DTYPE, 'best_step_by_clip': LABEL_DTYPE, 'best_step_by_aesthetic': LABEL_DTYPE,
+    'best_clip_score': 'float32', 'best_aesthetic': 'float32'
+}
+
+# Analysis charts are rendered at 150 dpi without the tight-bbox pass (every figure
+# is tight_layout'd first) and written with light PNG compression
+SAVE_KW = {'dpi': 150, 'bbox_inches': None, 'pil_kwargs': {'compress_level': 1}}
+
+# Category lists for the label columns (alphabetical, so grouped output keeps the sorted-string order)
+COUNTRY_ORDER = label_order(COUNTRY_KEYWORDS, 'Unknown')
+CATEGORY_ORDER = label_order(CATEGORY_KEYWORDS, 'other')
+VARIANT_ORDER = label_order(VARIANT_KEYWORDS, 'general')
+
+def top_k_positions(values, k, largest=True):
+    """Positions of the k largest (or smallest) values, ordered like nlargest/nsmallest with keep='first'"""
+    keys = -values if largest else values
+    missing = np.isnan(keys)
+    n = min(k, len(keys) - np.count_nonzero(missing))
+    top = np.empty(0, dtype=np.intp)
+    if n > 0:
+        # O(N) selection of the n-th key, then the earliest rows among ties at that key
+        kth = keys[np.argpartition(keys, n - 1)[n - 1]]
+        above = np.flatnonzero(keys < kth)
+        top = np.concatenate([above, np.flatnonzero(keys == kth)[:n - len(above)]])
+        top = top[np.argsort(keys[top], kind='stable')]
+    # Like pandas, fill up with the earliest NaN rows when there are fewer than k values
+    return np.concatenate([top, np.flatnonzero(missing)[:k - n]])
+
+def step_means(steps, scores):
+    """Mean score per observed step number, reduced with np.bincount on the small integer steps"""
+    steps = steps.to_numpy(dtype=np.intp)
+    scores = scores.to_numpy(dtype=np.float64)
+    valid = ~np.isnan(scores)
+    totals = np.bincount(steps[valid], weights=scores[valid], minlength=steps.max() + 1)
+    counts = np.bincount(steps[valid], minlength=steps.max() + 1)
+    observed = np.flatnonzero(np.bincount(steps))
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return observed, totals[observed] / counts[observed]
+
+def mean_matrix(df, row, column, value):
+    """Mean of value per (row, column) categorical cell as a frame, reduced with np.bincount on paired codes"""
+    row_codes = df[row].cat.codes.to_numpy(dtype=np.intp)
+    column_codes = df[column].cat.codes.to_numpy(dtype=np.intp)
+    n_rows, n_columns = len(df[row].cat.categories), len(df[column].cat.categories)
+    cells = row_codes * n_columns + column_codes
+    values = df[value].to_numpy(dtype=np.float64)
+    valid = ~np.isnan(values)
+    sums = np.bincount(cells[valid], weights=values[valid], minlength=n_rows * n_columns).reshape(n_rows, n_columns)
+    counts = np.bincount(cells[valid], minlength=n_rows * n_columns).reshape(n_rows, n_columns)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        means = sums / counts
+    # Keep only rows/columns with at least one value, like pivot_table's dropna
+    keep_rows, keep_columns = counts.any(axis=1), counts.any(axis=0)
+    return pd.DataFrame(means[np.ix_(keep_rows, keep_columns)],
+                        index=pd.Index(df[row].cat.categories[keep_rows], name=row),
+                        columns=pd.Index(df[column].cat.categories[keep_columns], name=column))
+
+def exclude_label(df, column, label):
+    """Rows of df whose categorical column is not label, with label dropped from its categories"""
+    subset = df[df[column] != label]
+    return subset.assign(**{column: subset[column].cat.remove_categories(label)})
+
+# One standalone Figure per process, cleared and reused by every chart instead of
+# creating (and registering with pyplot) a new figure and canvas each time
+_plot_figure = None
+
+def get_plot_figure(figsize):
+    """Return this process's reusable Figure, cleared and resized for the next chart"""
+    global _plot_figure
+    if _plot_figure is None:
+        _plot_figure = Figure()
+    _plot_figure.clf()
+    _plot_figure.set_size_inches(figsize)
+    return _plot_figure
+
+# Analyzer copy held by each plotting worker process
+_worker_analyzer = None
+
+def _init_plot_worker(analyzer):
+    """Keep one copy of the analyzer per worker process"""
+    global _worker_analyzer
+    _worker_analyzer = analyzer
+    load_plotting()
+
+def _run_plot(method_name):
+    """Render one chart in a worker and return what it printed"""
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer):
+        getattr(_worker_analyzer, method_name)()
+    return buffer.getvalue()
 
 class GeneralMetricsAnalyzer:
-    def __init__(self, general_metrics_path, general_summary_path, model_name="Model"):
+    def __init__(self, general_summary_path, model_name="Model"):
         """
         Initialize the analyzer with paths to general metrics files
 
         Args:
-            general_metrics_path: Path to detailed general metrics CSV
             general_summary_path: Path to general metrics summary CSV
             model_name: Name of the model for display purposes
         """
-        self.general_metrics_path = general_metrics_path
         self.general_summary_path = general_summary_path
         self.model_name = model_name
 
@@ -36,8 +163,8 @@ class GeneralMetricsAnalyzer:
         os.makedirs(self.charts_dir, exist_ok=True)
 
         # Load data
-        self.detailed_df = pd.read_csv(general_metrics_path)
-        self.summary_df = pd.read_csv(general_summary_path)
+        self.summary_df = pd.read_csv(general_summary_path, usecols=list(SUMMARY_DTYPES),
+                                      dtype=SUMMARY_DTYPES, engine=CSV_ENGINE)
 
         # Clean and prepare data
         self._prepare_data()
@@ -45,67 +172,54 @@ class GeneralMetricsAnalyzer:
     def _prepare_data(self):
         """Prepare and clean the data for analysis"""
         # Extract country and category information from prompts
-        self.summary_df['country'] = self.summary_df['prompt'].apply(self._extract_country)
-        self.summary_df['category'] = self.summary_df['prompt'].apply(self._extract_category)
-        self.summary_df['variant'] = self.summary_df['prompt'].apply(self._extract_variant)
-
-        # Clean step information
-        self.summary_df['best_clip_step_clean'] = self.summary_df['best_step_by_clip'].str.replace('_path', '')
-        self.summary_df['best_aesthetic_step_clean'] = self.summary_df['best_step_by_aesthetic'].str.replace('_path', '')
-
-        # Extract step numbers for analysis
-        self.summary_df['best_clip_step_num'] = self.summary_df['best_clip_step_clean'].str.extract('(\d+)').fillna('0').astype(int)
-        self.summary_df['best_aesthetic_step_num'] = self.summary_df['best_aesthetic_step_clean'].str.extract('(\d+)').fillna('0').astype(int)
-
-    def _extract_country(self, prompt):
-        """Extract country from prompt"""
-        prompt_lower = prompt.lower()
-        if 'china' in prompt_lower:
-            return 'China'
-        elif 'korea' in prompt_lower:
-            return 'Korea'
-        elif 'india' in prompt_lower:
-            return 'India'
-        elif 'kenya' in prompt_lower:
-            return 'Kenya'
-        elif 'nigeria' in prompt_lower:
-            return 'Nigeria'
-        elif 'united states' in prompt_lower or 'america' in prompt_lower:
-            return 'United_States'
-        return 'Unknown'
-
-    def _extract_category(self, prompt):
-        """Extract category from prompt"""
-        prompt_lower = prompt.lower()
-        if any(word in prompt_lower for word in ['house', 'landmark', 'building']):
-            return 'architecture'
-        elif any(word in prompt_lower for word in ['dance', 'painting', 'music']):
-            return 'art'
-        elif any(word in prompt_lower for word in ['wedding', 'funeral', 'festival', 'game', 'sport']):
-            return 'event'
-        elif any(word in prompt_lower for word in ['clothing', 'accessories', 'makeup']):
-            return 'fashion'
-        elif any(word in prompt_lower for word in ['food', 'dessert', 'drink']):
-            return 'food'
-        elif any(word in prompt_lower for word in ['animal', 'wildlife']):
-            return 'wildlife'
-        elif any(word in prompt_lower for word in ['landscape', 'nature']):
-            return 'landscape'
-        return 'other'
-
-    def _extract_variant(self, prompt):
-        """Extract variant from prompt"""
-        prompt_lower = prompt.lower()
-        if 'traditional' in prompt_lower:
-            return 'traditional'
-        elif 'modern' in prompt_lower:
-            return 'modern'
-        elif 'national' in prompt_lower:
-            return 'national'
-        elif 'common' in prompt_lower:
-            return 'common'
-        else:
-            return 'general'
+        labels = classify_prompts(self.summary_df['prompt'])
+
+        # Categorical labels: groupbys and pivots below work on integer codes instead of strings
+        self.summary_df['country'] = pd.Categorical(labels['country'], categories=COUNTRY_ORDER)
+        self.summary_df['category'] = pd.Categorical(labels['category'], categories=CATEGORY_ORDER)
+        self.summary_df['variant'] = pd.Categorical(labels['variant'], categories=VARIANT_ORDER)
+
+        # Clean step information and extract step numbers for analysis (int16, as in step_by_step_analysis)
+        for metric, source in [('clip', 'best_step_by_clip'), ('aesthetic', 'best_step_by_aesthetic')]:
+            steps = self.summary_df[source].str.removesuffix('_path')
+            self.summary_df[f'best_{metric}_step_clean'] = steps.astype('category')
+            self.summary_df[f'best_{metric}_step_num'] = pd.to_numeric(
+                steps.str.extract(r'(\d+)', expand=False), errors='coerce').fillna(0).astype(np.int16)
+
+        # Overall score statistics, reduced once for the overview and the summary report
+        self._score_stats = self.summary_df[['best_clip_score', 'best_aesthetic']].agg(['mean', 'std', 'min', 'max'])
+
+        # Rows with a known country / category, filtered once and shared by the plots and the report
+        self._country_known = exclude_label(self.summary_df, 'country', 'Unknown')
+        self._category_known = exclude_label(self.summary_df, 'category', 'other')
+
+        # Row order and group boundaries for the box plots, so each panel only
+        # slices a sorted column instead of re-grouping its frame
+        self._group_splits = {}
+        for key, frame in [('country', self._country_known), ('category', self._category_known),
+                           ('variant', self.summary_df)]:
+            codes = frame[key].cat.codes.to_numpy()
+            order = np.argsort(codes, kind='stable')
+            group_codes, starts = np.unique(codes[order], return_index=True)
+            labels = frame[key].cat.categories[group_codes]
+            self._group_splits[key] = (frame, order, starts[1:], labels)
+
+    def _grouped_values(self, key, column):
+        """Split a column into per-group arrays (NaNs dropped) in category order"""
+        frame, order, boundaries, labels = self._group_splits[key]
+        values = frame[column].to_numpy(dtype=float)[order]
+        groups = [group[~np.isnan(group)] for group in np.split(values, boundaries)]
+        return labels, groups
+
+    def _draw_boxplot(self, ax, key, column):
+        """Draw per-group box plots with matplotlib from precomputed quartile/whisker stats"""
+        labels, groups = self._grouped_values(key, column)
+        stats = cbook.boxplot_stats(groups, labels=labels)
+        line = {'color': '0.3'}
+        ax.bxp(stats, widths=0.8, patch_artist=True,
+               boxprops={'facecolor': sns.desaturate(sns.color_palette()[0], 0.75), 'edgecolor': '0.3'},
+               medianprops=line, whiskerprops=line, capprops=line,
+               flierprops={'markeredgecolor': '0.3'})
 
     def analyze_overall_performance(self):
         """Analyze overall performance metrics"""
@@ -115,22 +229,25 @@ class GeneralMetricsAnalyzer:
 
         # Overall statistics
         total_evaluations = len(self.summary_df)
-        countries = self.summary_df['country'].unique()
-        categories = self.summary_df['category'].unique()
-        variants = self.summary_df['variant'].unique()
+        # Observed labels in their categorical order, which is already alphabetical
+        countries = self.summary_df['country'].unique().sort_values()
+        categories = self.summary_df['category'].unique().sort_values()
+        variants = self.summary_df['variant'].unique().sort_values()
 
         print(f"\nDataset Overview:")
         print(f"- Total evaluations: {total_evaluations}")
-        print(f"- Countries analyzed: {len(countries)} ({', '.join(sorted(countries))})")
-        print(f"- Categories: {len(categories)} ({', '.join(sorted(categories))})")
-        print(f"- Variants: {len(variants)} ({', '.join(sorted(variants))})")
+        print(f"- Countries analyzed: {len(countries)} ({', '.join(countries)})")
+        print(f"- Categories: {len(categories)} ({', '.join(categories)})")
+        print(f"- Variants: {len(variants)} ({', '.join(variants)})")
 
         # Overall performance metrics
         print(f"\nOverall Performance Metrics:")
-        print(f"- Average CLIP Score: {self.summary_df['best_clip_score'].mean():.2f} ± {self.summary_df['best_clip_score'].std():.2f}")
-        print(f"- CLIP Score Range: [{self.summary_df['best_clip_score'].min():.2f}, {self.summary_df['best_clip_score'].max():.2f}]")
-        print(f"- Average Aesthetic Score: {self.summary_df['best_aesthetic'].mean():.2f} ± {self.summary_df['best_aesthetic'].std():.2f}")
-        print(f"- Aesthetic Score Range: [{self.summary_df['best_aesthetic'].min():.2f}, {self.summary_df['best_aesthetic'].max():.2f}]")
+        clip_stats = self._score_stats['best_clip_score']
+        aesthetic_stats = self._score_stats['best_aesthetic']
+        print(f"- Average CLIP Score: {clip_stats['mean']:.2f} ± {clip_stats['std']:.2f}")
+        print(f"- CLIP Score Range: [{clip_stats['min']:.2f}, {clip_stats['max']:.2f}]")
+        print(f"- Average Aesthetic Score: {aesthetic_stats['mean']:.2f} ± {aesthetic_stats['std']:.2f}")
+        print(f"- Aesthetic Score Range: [{aesthetic_stats['min']:.2f}, {aesthetic_stats['max']:.2f}]")
 
     def analyze_country_performance(self):
         """Analyze performance by country"""
@@ -138,18 +255,19 @@ class GeneralMetricsAnalyzer:
         print("COUNTRY-SPECIFIC ANALYSIS")
         print("=" * 60)
 
-        country_stats = self.summary_df.groupby('country').agg({
+        country_stats = self.summary_df.groupby('country', observed=True).agg({
             'best_clip_score': ['mean', 'std', 'count'],
             'best_aesthetic': ['mean', 'std'],
             'best_clip_step_num': 'mean',
             'best_aesthetic_step_num': 'mean'
-        }).round(3)
+        }).astype(np.float64).round(3)
 
         # Flatten column names
         country_stats.columns = ['_'.join(col).strip() for col in country_stats.columns]
 
+        # Groups come out in COUNTRY_ORDER, so the index needs no re-sorting
         print(f"\nPerformance by Country:")
-        for country in sorted(country_stats.index):
+        for country in country_stats.index:
             if country == 'Unknown':
                 continue
             stats = country_stats.loc[country]
@@ -166,21 +284,21 @@ class GeneralMetricsAnalyzer:
         print("STEP PERFORMANCE ANALYSIS")
         print("=" * 60)
 
-        # CLIP Score best steps
+        # CLIP Score best steps: case count and average score per step in one grouped pass
         print(f"\nBest CLIP Score by Step:")
-        clip_step_counts = self.summary_df['best_clip_step_clean'].value_counts()
-        for step, count in clip_step_counts.items():
+        clip_agg = self.summary_df.groupby('best_clip_step_clean', sort=False, observed=True)['best_clip_score'].agg(
+            count='size', mean='mean').sort_values('count', ascending=False, kind='stable')
+        for step, count, mean in clip_agg.itertuples(name=None):
             percentage = (count / len(self.summary_df)) * 100
-            avg_score = self.summary_df[self.summary_df['best_clip_step_clean'] == step]['best_clip_score'].mean()
-            print(f"  {step}: {count} cases ({percentage:.1f}%) - Avg Score: {avg_score:.2f}")
+            print(f"  {step}: {int(count)} cases ({percentage:.1f}%) - Avg Score: {mean:.2f}")
 
         # Aesthetic Score best steps
         print(f"\nBest Aesthetic Score by Step:")
-        aesthetic_step_counts = self.summary_df['best_aesthetic_step_clean'].value_counts()
-        for step, count in aesthetic_step_counts.items():
+        aesthetic_agg = self.summary_df.groupby('best_aesthetic_step_clean', sort=False, observed=True)['best_aesthetic'].agg(
+            count='size', mean='mean').sort_values('count', ascending=False, kind='stable')
+        for step, count, mean in aesthetic_agg.itertuples(name=None):
             percentage = (count / len(self.summary_df)) * 100
-            avg_score = self.summary_df[self.summary_df['best_aesthetic_step_clean'] == step]['best_aesthetic'].mean()
-            print(f"  {step}: {count} cases ({percentage:.1f}%) - Avg Score: {avg_score:.2f}")
+            print(f"  {step}: {int(count)} cases ({percentage:.1f}%) - Avg Score: {mean:.2f}")
 
     def analyze_category_performance(self):
         """Analyze performance by category and variant"""
@@ -189,13 +307,13 @@ class GeneralMetricsAnalyzer:
         print("=" * 60)
 
         # Performance by category
-        category_stats = self.summary_df.groupby('category').agg({
+        category_stats = self.summary_df.groupby('category', observed=True).agg({
             'best_clip_score': ['mean', 'std', 'count'],
             'best_aesthetic': ['mean', 'std']
-        }).round(3)
+        }).astype(np.float64).round(3)
 
         print(f"\nPerformance by Category:")
-        for category in sorted(category_stats.index):
+        for category in category_stats.index:
             if category == 'other':
                 continue
             stats = category_stats.loc[category]
@@ -205,13 +323,13 @@ class GeneralMetricsAnalyzer:
             print(f"  Aesthetic Score: {stats[('best_aesthetic', 'mean')]:.2f} ± {stats[('best_aesthetic', 'std')]:.2f}")
 
         # Performance by variant
-        variant_stats = self.summary_df.groupby('variant').agg({
+        variant_stats = self.summary_df.groupby('variant', observed=True).agg({
             'best_clip_score': ['mean', 'std', 'count'],
             'best_aesthetic': ['mean', 'std']
-        }).round(3)
+        }).astype(np.float64).round(3)
 
         print(f"\nPerformance by Variant:")
-        for variant in sorted(variant_stats.index):
+        for variant in variant_stats.index:
             stats = variant_stats.loc[variant]
             print(f"\n{variant.upper()}:")
             print(f"  Evaluations: {int(stats[('best_clip_score', 'count')])}")
@@ -224,53 +342,58 @@ class GeneralMetricsAnalyzer:
         print("BEST & WORST PERFORMERS")
         print("=" * 60)
 
+        # Select the report columns once and partial-sort the score arrays for each top 10
+        performers = self.summary_df[['country', 'category', 'variant', 'best_clip_score', 'best_aesthetic']]
+        clip_scores = performers['best_clip_score'].to_numpy(dtype=np.float64)
+        aesthetic_scores = performers['best_aesthetic'].to_numpy(dtype=np.float64)
+
         # Best performers by CLIP score
-        best_clip = self.summary_df.nlargest(10, 'best_clip_score')[['prompt', 'country', 'category', 'variant', 'best_clip_score', 'best_aesthetic']]
+        best_clip = performers.iloc[top_k_positions(clip_scores, 10)]
         print(f"\nTop 10 Best Performers (by CLIP Score):")
-        for idx, row in best_clip.iterrows():
-            print(f"  {row['country']} - {row['category']}/{row['variant']}: CLIP={row['best_clip_score']:.2f}, Aesthetic={row['best_aesthetic']:.2f}")
+        for country, category, variant, clip, aesthetic in best_clip.itertuples(index=False, name=None):
+            print(f"  {country} - {category}/{variant}: CLIP={clip:.2f}, Aesthetic={aesthetic:.2f}")
 
         # Best performers by Aesthetic score
-        best_aesthetic = self.summary_df.nlargest(10, 'best_aesthetic')[['prompt', 'country', 'category', 'variant', 'best_clip_score', 'best_aesthetic']]
+        best_aesthetic = performers.iloc[top_k_positions(aesthetic_scores, 10)]
         print(f"\nTop 10 Best Performers (by Aesthetic Score):")
-        for idx, row in best_aesthetic.iterrows():
-            print(f"  {row['country']} - {row['category']}/{row['variant']}: CLIP={row['best_clip_score']:.2f}, Aesthetic={row['best_aesthetic']:.2f}")
+        for country, category, variant, clip, aesthetic in best_aesthetic.itertuples(index=False, name=None):
+            print(f"  {country} - {category}/{variant}: CLIP={clip:.2f}, Aesthetic={aesthetic:.2f}")
 
         # Worst performers by CLIP score
-        worst_clip = self.summary_df.nsmallest(10, 'best_clip_score')[['prompt', 'country', 'category', 'variant', 'best_clip_score', 'best_aesthetic']]
+        worst_clip = performers.iloc[top_k_positions(clip_scores, 10, largest=False)]
         print(f"\nTop 10 Worst Performers (by CLIP Score):")
-        for idx, row in worst_clip.iterrows():
-            print(f"  {row['country']} - {row['category']}/{row['variant']}: CLIP={row['best_clip_score']:.2f}, Aesthetic={row['best_aesthetic']:.2f}")
+        for country, category, variant, clip, aesthetic in worst_clip.itertuples(index=False, name=None):
+            print(f"  {country} - {category}/{variant}: CLIP={clip:.2f}, Aesthetic={aesthetic:.2f}")
 
     def create_visualizations(self):
         """Create comprehensive visualizations for general metrics"""
         print(f"\n" + "=" * 60)
         print("GENERATING VISUALIZATIONS")
         print("=" * 60)
-
-        # 1. Overall Performance Distribution
-        self._plot_performance_distribution()
-
-        # 2. Country Performance Analysis
-        self._plot_country_performance()
-
-        # 3. Step Analysis
-        self._plot_step_analysis()
-
-        # 4. Category Performance
-        self._plot_category_performance()
-
-        # 5. CLIP vs Aesthetic Correlation
-        self._plot_clip_vs_aesthetic()
-
-        # 6. Advanced Heatmaps
-        self._plot_advanced_heatmaps()
+        load_plotting()
+
+        plot_methods = [
+            '_plot_performance_distribution',   # 1. Overall Performance Distribution
+            '_plot_country_performance',        # 2. Country Performance Analysis
+            '_plot_step_analysis',              # 3. Step Analysis
+            '_plot_category_performance',       # 4. Category Performance
+            '_plot_clip_vs_aesthetic',          # 5. CLIP vs Aesthetic Correlation
+            '_plot_advanced_heatmaps',          # 6. Advanced Heatmaps
+        ]
+
+        # Each chart writes its own PNG, so render them in worker processes that
+        # receive the analyzer once; their output is printed here in chart order
+        with ProcessPoolExecutor(max_workers=min(len(plot_methods), MAX_WORKERS),
+                                 initializer=_init_plot_worker, initargs=(self,)) as executor:
+            for output in executor.map(_run_plot, plot_methods):
+                print(output, end='')
 
         print(f"\nAll visualizations saved to: {self.charts_dir}")
 
     def _plot_performance_distribution(self):
         """Plot overall performance distribution"""
-        fig, axes = plt.subplots(1, 2, figsize=(14, 6))
+        fig = get_plot_figure((14, 6))
+        axes = fig.subplots(1, 2)
         fig.suptitle(f'{self.model_name.upper()} - Performance Distribution', fontsize=16, fontweight='bold')
 
         # CLIP Score distribution
@@ -293,57 +416,54 @@ class GeneralMetricsAnalyzer:
         axes[1].legend()
         axes[1].grid(True, alpha=0.3)
 
-        plt.tight_layout()
+        fig.tight_layout()
         save_path = os.path.join(self.charts_dir, f"{self.model_name}_performance_distribution.png")
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.savefig(save_path, **SAVE_KW)
         print(f"Generated: {save_path}")
 
     def _plot_country_performance(self):
         """Plot performance by country"""
-        fig, axes = plt.subplots(2, 2, figsize=(16, 12))
+        fig = get_plot_figure((16, 12))
+        axes = fig.subplots(2, 2)
         fig.suptitle(f'{self.model_name.upper()} - Country Performance Analysis', fontsize=16, fontweight='bold')
 
-        # Filter out unknown countries
-        country_data = self.summary_df[self.summary_df['country'] != 'Unknown']
-
         # CLIP Score by country
-        sns.boxplot(data=country_data, x='country', y='best_clip_score', ax=axes[0, 0])
+        self._draw_boxplot(axes[0, 0], 'country', 'best_clip_score')
         axes[0, 0].set_title('CLIP Score by Country')
         axes[0, 0].set_xlabel('Country')
         axes[0, 0].set_ylabel('CLIP Score')
         axes[0, 0].tick_params(axis='x', rotation=45)
 
         # Aesthetic Score by country
-        sns.boxplot(data=country_data, x='country', y='best_aesthetic', ax=axes[0, 1])
+        self._draw_boxplot(axes[0, 1], 'country', 'best_aesthetic')
         axes[0, 1].set_title('Aesthetic Score by Country')
         axes[0, 1].set_xlabel('Country')
         axes[0, 1].set_ylabel('Aesthetic Score')
         axes[0, 1].tick_params(axis='x', rotation=45)
 
         # Best CLIP step by country
-        sns.boxplot(data=country_data, x='country', y='best_clip_step_num', ax=axes[1, 0])
+        self._draw_boxplot(axes[1, 0], 'country', 'best_clip_step_num')
         axes[1, 0].set_title('Best CLIP Step by Country')
         axes[1, 0].set_xlabel('Country')
         axes[1, 0].set_ylabel('Best CLIP Step Number')
         axes[1, 0].tick_params(axis='x', rotation=45)
 
         # Best Aesthetic step by country
-        sns.boxplot(data=country_data, x='country', y='best_aesthetic_step_num', ax=axes[1, 1])
+        self._draw_boxplot(axes[1, 1], 'country', 'best_aesthetic_step_num')
         axes[1, 1].set_title('Best Aesthetic Step by Country')
         axes[1, 1].set_xlabel('Country')
         axes[1, 1].set_ylabel('Best Aesthetic Step Number')
         axes[1, 1].tick_params(axis='x', rotation=45)
 
-        plt.tight_layout()
+        fig.tight_layout()
         save_path = os.path.join(self.charts_dir, f"{self.model_name}_country_performance.png")
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.savefig(save_path, **SAVE_KW)
         print(f"Generated: {save_path}")
 
     def _plot_step_analysis(self):
         """Plot step analysis"""
-        fig, axes = plt.subplots(2, 2, figsize=(16, 12))
+        fig = get_plot_figure((16, 12))
+        axes = fig.subplots(2, 2)
         fig.suptitle(f'{self.model_name.upper()} - Step Analysis', fontsize=16, fontweight='bold')
 
         # CLIP step distribution
@@ -363,75 +483,72 @@ class GeneralMetricsAnalyzer:
         axes[0, 1].tick_params(axis='x', rotation=45)
 
         # Step vs Score correlation
-        step_clip_scores = self.summary_df.groupby('best_clip_step_num')['best_clip_score'].mean()
-        axes[1, 0].plot(step_clip_scores.index, step_clip_scores.values, 'bo-', linewidth=2, markersize=8)
+        steps, means = step_means(self.summary_df['best_clip_step_num'], self.summary_df['best_clip_score'])
+        axes[1, 0].plot(steps, means, 'bo-', linewidth=2, markersize=8)
         axes[1, 0].set_title('Average CLIP Score by Step')
         axes[1, 0].set_xlabel('Step Number')
         axes[1, 0].set_ylabel('Average CLIP Score')
         axes[1, 0].grid(True, alpha=0.3)
 
-        step_aesthetic_scores = self.summary_df.groupby('best_aesthetic_step_num')['best_aesthetic'].mean()
-        axes[1, 1].plot(step_aesthetic_scores.index, step_aesthetic_scores.values, 'go-', linewidth=2, markersize=8)
+        steps, means = step_means(self.summary_df['best_aesthetic_step_num'], self.summary_df['best_aesthetic'])
+        axes[1, 1].plot(steps, means, 'go-', linewidth=2, markersize=8)
         axes[1, 1].set_title('Average Aesthetic Score by Step')
         axes[1, 1].set_xlabel('Step Number')
         axes[1, 1].set_ylabel('Average Aesthetic Score')
         axes[1, 1].grid(True, alpha=0.3)
 
-        plt.tight_layout()
+        fig.tight_layout()
         save_path = os.path.join(self.charts_dir, f"{self.model_name}_step_analysis.png")
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.savefig(save_path, **SAVE_KW)
         print(f"Generated: {save_path}")
 
     def _plot_category_performance(self):
         """Plot category performance"""
-        fig, axes = plt.subplots(2, 2, figsize=(16, 12))
+        fig = get_plot_figure((16, 12))
+        axes = fig.subplots(2, 2)
         fig.suptitle(f'{self.model_name.upper()} - Category Performance', fontsize=16, fontweight='bold')
 
-        # Filter out 'other' category
-        category_data = self.summary_df[self.summary_df['category'] != 'other']
-
         # CLIP Score by category
-        sns.boxplot(data=category_data, x='category', y='best_clip_score', ax=axes[0, 0])
+        self._draw_boxplot(axes[0, 0], 'category', 'best_clip_score')
         axes[0, 0].set_title('CLIP Score by Category')
         axes[0, 0].set_xlabel('Category')
         axes[0, 0].set_ylabel('CLIP Score')
         axes[0, 0].tick_params(axis='x', rotation=45)
 
         # Aesthetic Score by category
-        sns.boxplot(data=category_data, x='category', y='best_aesthetic', ax=axes[0, 1])
+        self._draw_boxplot(axes[0, 1], 'category', 'best_aesthetic')
         axes[0, 1].set_title('Aesthetic Score by Category')
         axes[0, 1].set_xlabel('Category')
         axes[0, 1].set_ylabel('Aesthetic Score')
         axes[0, 1].tick_params(axis='x', rotation=45)
 
         # CLIP Score by variant
-        sns.boxplot(data=self.summary_df, x='variant', y='best_clip_score', ax=axes[1, 0])
+        self._draw_boxplot(axes[1, 0], 'variant', 'best_clip_score')
         axes[1, 0].set_title('CLIP Score by Variant')
         axes[1, 0].set_xlabel('Variant')
         axes[1, 0].set_ylabel('CLIP Score')
         axes[1, 0].tick_params(axis='x', rotation=45)
 
         # Aesthetic Score by variant
-        sns.boxplot(data=self.summary_df, x='variant', y='best_aesthetic', ax=axes[1, 1])
+        self._draw_boxplot(axes[1, 1], 'variant', 'best_aesthetic')
         axes[1, 1].set_title('Aesthetic Score by Variant')
         axes[1, 1].set_xlabel('Variant')
         axes[1, 1].set_ylabel('Aesthetic Score')
         axes[1, 1].tick_params(axis='x', rotation=45)
 
-        plt.tight_layout()
+        fig.tight_layout()
         save_path = os.path.join(self.charts_dir, f"{self.model_name}_category_performance.png")
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.savefig(save_path, **SAVE_KW)
         print(f"Generated: {save_path}")
 
     def _plot_clip_vs_aesthetic(self):
         """Plot CLIP vs Aesthetic correlation"""
-        fig, axes = plt.subplots(1, 2, figsize=(16, 6))
+        fig = get_plot_figure((16, 6))
+        axes = fig.subplots(1, 2)
         fig.suptitle(f'{self.model_name.upper()} - CLIP vs Aesthetic Analysis', fontsize=16, fontweight='bold')
 
         # Overall correlation
-        country_data = self.summary_df[self.summary_df['country'] != 'Unknown']
+        country_data = self._country_known
         sns.scatterplot(data=country_data, x='best_clip_score', y='best_aesthetic',
                        hue='country', alpha=0.7, ax=axes[0])
         axes[0].set_title('CLIP vs Aesthetic Score by Country')
@@ -445,34 +562,29 @@ class GeneralMetricsAnalyzer:
                     bbox=dict(boxstyle='round', facecolor='white', alpha=0.8))
 
         # Category correlation
-        category_data = self.summary_df[self.summary_df['category'] != 'other']
+        category_data = self._category_known
         sns.scatterplot(data=category_data, x='best_clip_score', y='best_aesthetic',
                        hue='category', alpha=0.7, ax=axes[1])
         axes[1].set_title('CLIP vs Aesthetic Score by Category')
         axes[1].set_xlabel('CLIP Score')
         axes[1].set_ylabel('Aesthetic Score')
 
-        plt.tight_layout()
+        fig.tight_layout()
         save_path = os.path.join(self.charts_dir, f"{self.model_name}_clip_vs_aesthetic.png")
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.savefig(save_path, **SAVE_KW)
         print(f"Generated: {save_path}")
 
     def _plot_advanced_heatmaps(self):
         """Plot advanced heatmaps"""
-        fig, axes = plt.subplots(2, 2, figsize=(18, 14))
+        fig = get_plot_figure((18, 14))
+        axes = fig.subplots(2, 2)
         fig.suptitle(f'{self.model_name.upper()} - Advanced Performance Heatmaps', fontsize=16, fontweight='bold')
 
-        # Filter data
-        filtered_data = self.summary_df[self.summary_df['country'] != 'Unknown']
+        # Filter data; each heatmap's cell means come from one bincount over country/column codes
+        filtered_data = self._country_known
 
         # CLIP Score heatmap by country and category
-        clip_pivot = filtered_data.pivot_table(
-            values='best_clip_score',
-            index='country',
-            columns='category',
-            aggfunc='mean'
-        )
+        clip_pivot = mean_matrix(filtered_data, 'country', 'category', 'best_clip_score')
 
         sns.heatmap(clip_pivot, annot=True, fmt='.1f', cmap='Blues',
                    ax=axes[0, 0], cbar_kws={'label': 'CLIP Score'})
@@ -481,12 +593,7 @@ class GeneralMetricsAnalyzer:
         axes[0, 0].set_ylabel('Country')
 
         # Aesthetic Score heatmap by country and category
-        aesthetic_pivot = filtered_data.pivot_table(
-            values='best_aesthetic',
-            index='country',
-            columns='category',
-            aggfunc='mean'
-        )
+        aesthetic_pivot = mean_matrix(filtered_data, 'country', 'category', 'best_aesthetic')
 
         sns.heatmap(aesthetic_pivot, annot=True, fmt='.1f', cmap='Greens',
                    ax=axes[0, 1], cbar_kws={'label': 'Aesthetic Score'})
@@ -495,12 +602,7 @@ class GeneralMetricsAnalyzer:
         axes[0, 1].set_ylabel('Country')
 
         # Best CLIP step heatmap by country and variant
-        clip_step_pivot = filtered_data.pivot_table(
-            values='best_clip_step_num',
-            index='country',
-            columns='variant',
-            aggfunc='mean'
-        )
+        clip_step_pivot = mean_matrix(filtered_data, 'country', 'variant', 'best_clip_step_num')
 
         sns.heatmap(clip_step_pivot, annot=True, fmt='.1f', cmap='Reds',
                    ax=axes[1, 0], cbar_kws={'label': 'Best CLIP Step'})
@@ -509,12 +611,7 @@ class GeneralMetricsAnalyzer:
         axes[1, 0].set_ylabel('Country')
 
         # Best Aesthetic step heatmap by country and variant
-        aesthetic_step_pivot = filtered_data.pivot_table(
-            values='best_aesthetic_step_num',
-            index='country',
-            columns='variant',
-            aggfunc='mean'
-        )
+        aesthetic_step_pivot = mean_matrix(filtered_data, 'country', 'variant', 'best_aesthetic_step_num')
 
         sns.heatmap(aesthetic_step_pivot, annot=True, fmt='.1f', cmap='Purples',
                    ax=axes[1, 1], cbar_kws={'label': 'Best Aesthetic Step'})
@@ -522,10 +619,9 @@ class GeneralMetricsAnalyzer:
         axes[1, 1].set_xlabel('Variant')
         axes[1, 1].set_ylabel('Country')
 
-        plt.tight_layout()
+        fig.tight_layout()
         save_path = os.path.join(self.charts_dir, f"{self.model_name}_advanced_heatmaps.png")
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.savefig(save_path, **SAVE_KW)
         print(f"Generated: {save_path}")
 
     def generate_summary_report(self):
@@ -535,17 +631,17 @@ class GeneralMetricsAnalyzer:
         print("=" * 80)
 
         # Key findings
-        overall_clip = self.summary_df['best_clip_score'].mean()
-        overall_aesthetic = self.summary_df['best_aesthetic'].mean()
+        overall_clip = self._score_stats.at['mean', 'best_clip_score']
+        overall_aesthetic = self._score_stats.at['mean', 'best_aesthetic']
 
-        country_data = self.summary_df[self.summary_df['country'] != 'Unknown']
-        best_clip_country = country_data.groupby('country')['best_clip_score'].mean().idxmax()
-        worst_clip_country = country_data.groupby('country')['best_clip_score'].mean().idxmin()
-        best_aesthetic_country = country_data.groupby('country')['best_aesthetic'].mean().idxmax()
+        country_data = self._country_known
+        best_clip_country = country_data.groupby('country', observed=True)['best_clip_score'].mean().idxmax()
+        worst_clip_country = country_data.groupby('country', observed=True)['best_clip_score'].mean().idxmin()
+        best_aesthetic_country = country_data.groupby('country', observed=True)['best_aesthetic'].mean().idxmax()
 
-        category_data = self.summary_df[self.summary_df['category'] != 'other']
-        best_clip_category = category_data.groupby('category')['best_clip_score'].mean().idxmax()
-        best_aesthetic_category = category_data.groupby('category')['best_aesthetic'].mean().idxmax()
+        category_data = self._category_known
+        best_clip_category = category_data.groupby('category', observed=True)['best_clip_score'].mean().idxmax()
+        best_aesthetic_category = category_data.groupby('category', observed=True)['best_aesthetic'].mean().idxmax()
 
         print(f"\nKEY FINDINGS:")
         print(f"- Overall CLIP Score: {overall_clip:.2f}")
@@ -580,20 +676,15 @@ def main(model_name):
     script_dir = os.path.dirname(os.path.abspath(__file__))
     base_path = os.path.join(script_dir, '..', '..', 'output', model_name)
 
-    general_metrics_path = os.path.join(base_path, 'general_metrics.csv')
     general_summary_path = os.path.join(base_path, 'general_metrics_summary.csv')
 
     # Check if files exist
-    if not os.path.exists(general_metrics_path):
-        print(f"Error: General metrics file not found at {general_metrics_path}")
-        return
-
     if not os.path.exists(general_summary_path):
         print(f"Error: General summary file not found at {general_summary_path}")
         return
 
     # Initialize analyzer
-    analyzer = GeneralMetricsAnalyzer(general_metrics_path, general_summary_path, model_name)
+    analyzer = GeneralMetricsAnalyzer(general_summary_path, model_name)
 
     # Run all analyses
     analyzer.analyze_overall_performance()
@@ -6,10 +6,19 @@ Focus on how each model performs at different generation steps and identify opti
 
 import pandas as pd
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 import seaborn as sns
 import os
+import re
 from collections import defaultdict
+from functools import lru_cache
+import sys
+
+# Shared analysis helpers live in scripts/core
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'core'))
+from prompt_labels import classify_prompts
 
 # Set up plotting style
 plt.style.use('default')
@@ -19,6 +28,89 @@ sns.set_palette("husl")
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 BASE_CHARTS_DIR = os.path.join(SCRIPT_DIR, '..', 'results', 'comparison', 'step_by_step_analysis')
 
+# Analysis charts are saved at draft resolution; only the final summary table keeps print resolution.
+# PNGs are written with a fast zlib level, trading slightly larger files for much quicker encoding
+DPI_DRAFT = 150
+DPI_FINAL = 300
+PNG_KW = {'bbox_inches': 'tight', 'pil_kwargs': {'compress_level': 1}}
+
+# Label columns kept as categoricals on the combined frames
+LABEL_COLUMNS = ['model', 'country', 'category', 'variant']
+
+# Step number inside step labels such as 'step3' or 'step3_path'
+_STEP_RE = re.compile(r'(\d+)')
+
+# Cultural metric panels of the step line chart (metric, axis label), in subplot order;
+# these metrics are averaged per model and step for the line charts and the report
+CULTURAL_STEP_PANELS = [
+    ('f1', 'F1 Score'),
+    ('cultural_representative', 'Cultural Representative Score'),
+    ('accuracy', 'Accuracy'),
+    ('prompt_alignment', 'Prompt Alignment')
+]
+CULTURAL_STEP_METRICS = [metric for metric, _ in CULTURAL_STEP_PANELS]
+# Cultural metrics shown in the country and category step heatmaps
+CULTURAL_HEATMAP_METRICS = ['f1', 'cultural_representative']
+
+def step_numbers(steps, default):
+    """Parse the step number out of each step label, using default where none is found"""
+    numbers = pd.to_numeric(steps.str.extract(_STEP_RE, expand=False), errors='coerce')
+    return numbers.fillna(default).astype('int16')
+
+def best_step_by_country(frame, metric, step_col):
+    """Step with the highest mean metric for each model and country, as a country x model table"""
+    means = frame.groupby(['model', 'country', step_col], observed=True)[metric].mean()
+    best = means.groupby(level=['model', 'country'], observed=True).idxmax()
+    return pd.Series([key[-1] for key in best], index=best.index).unstack('model')
+
+def downcast_floats(df):
+    """Store float64 columns as float32, halving their memory and the bandwidth of later groupbys"""
+    columns = df.select_dtypes('float64').columns
+    df[columns] = df[columns].astype(np.float32)
+    return df
+
+def clean_cultural_summary(df):
+    """Drop unlabelled rows, normalize labels and parse step numbers of a cultural summary"""
+    df = df.dropna(subset=['country', 'category', 'variant'])
+    df['country'] = df['country'].str.title()
+    df['variant'] = df['variant'].fillna('general')
+    df['step_num'] = step_numbers(df['step'], -1)
+    return downcast_floats(df)
+
+def clean_general_summary(df):
+    """Label prompts and parse the best-step numbers of a general summary"""
+    df = df.assign(**classify_prompts(df['prompt']))
+    
+    # The '_path' suffix carries no digits, so the numbers come straight from the raw labels
+    df['best_clip_step_num'] = step_numbers(df['best_step_by_clip'], 0)
+    df['best_aesthetic_step_num'] = step_numbers(df['best_step_by_aesthetic'], 0)
+    return downcast_floats(df)
+
+@lru_cache(maxsize=None)
+def load_model_frames(cultural_summary_path, general_summary_path, cultural_mtime, general_mtime):
+    """Cleaned cultural and general summaries of one model, memoized per file version"""
+    return (clean_cultural_summary(pd.read_csv(cultural_summary_path)),
+            clean_general_summary(pd.read_csv(general_summary_path)))
+
+def best_step_per_model(step_means, models):
+    """Step with the highest mean and that mean for each model, from a (model, step)-indexed Series; 0 for models without steps"""
+    best = step_means.groupby(level='model', observed=True).idxmax()
+    steps = pd.Series([key[-1] for key in best], index=best.index.astype(str))
+    scores = pd.Series(step_means.loc[best.to_list()].to_numpy(), index=steps.index)
+    return (steps.reindex(models, fill_value=0).astype(int).to_numpy(),
+            scores.reindex(models, fill_value=0).to_numpy())
+
+def combine_models(models_data, key):
+    """Concatenate one frame per model, tagging rows with a model column built from the concat keys"""
+    combined = pd.concat([data[key] for data in models_data.values()], keys=list(models_data), names=['model'])
+    return combined.reset_index('model').reset_index(drop=True)
+
+def split_by_model(grouped, models):
+    """Split a (model, step)-indexed aggregate into per-model step frames; models without rows get an empty one"""
+    present = set(grouped.index.unique('model'))
+    empty = grouped.iloc[:0].droplevel('model')
+    return {model: grouped.xs(model, level='model') if model in present else empty for model in models}
+
 class StepByStepAnalyzer:
     def __init__(self, model_configs):
         """
@@ -54,34 +146,13 @@ class StepByStepAnalyzer:
         """Load data for all models"""
         for model_name, config in self.model_configs.items():
             try:
-                # Load cultural data
-                cultural_detailed_df = pd.read_csv(config['cultural_metrics_path'])
-                cultural_summary_df = pd.read_csv(config['cultural_summary_path'])
-                
-                # Load general data
-                general_summary_df = pd.read_csv(config['general_summary_path'])
-                
-                # Clean and prepare cultural data
-                cultural_summary_df = cultural_summary_df.dropna(subset=['country', 'category', 'variant'])
-                cultural_summary_df['country'] = cultural_summary_df['country'].str.title()
-                cultural_summary_df['variant'] = cultural_summary_df['variant'].fillna('general')
-                cultural_summary_df['step_num'] = cultural_summary_df['step'].str.extract('(\d+)').fillna('-1').astype(int)
-                cultural_summary_df['model'] = model_name
-                
-                # Clean and prepare general data
-                general_summary_df['country'] = general_summary_df['prompt'].apply(self._extract_country)
-                general_summary_df['category'] = general_summary_df['prompt'].apply(self._extract_category)
-                general_summary_df['variant'] = general_summary_df['prompt'].apply(self._extract_variant)
-                general_summary_df['model'] = model_name
-                
-                # Clean step information for general data
-                general_summary_df['best_clip_step_clean'] = general_summary_df['best_step_by_clip'].str.replace('_path', '')
-                general_summary_df['best_aesthetic_step_clean'] = general_summary_df['best_step_by_aesthetic'].str.replace('_path', '')
-                general_summary_df['best_clip_step_num'] = general_summary_df['best_clip_step_clean'].str.extract('(\d+)').fillna('0').astype(int)
-                general_summary_df['best_aesthetic_step_num'] = general_summary_df['best_aesthetic_step_clean'].str.extract('(\d+)').fillna('0').astype(int)
+                # Load cleaned cultural and general summaries; the frames are shared
+                # between loads, and the model column is only added when combining
+                cultural_summary_df, general_summary_df = load_model_frames(
+                    config['cultural_summary_path'], config['general_summary_path'],
+                    os.path.getmtime(config['cultural_summary_path']), os.path.getmtime(config['general_summary_path']))
                 
                 self.models_data[model_name] = {
-                    'cultural_detailed': cultural_detailed_df,
                     'cultural_summary': cultural_summary_df,
                     'general_summary': general_summary_df
                 }
@@ -93,61 +164,30 @@ class StepByStepAnalyzer:
                 
         # Combine all data for comparison
         if self.models_data:
-            self.combined_cultural = pd.concat([data['cultural_summary'] for data in self.models_data.values()], 
-                                             ignore_index=True)
-            self.combined_general = pd.concat([data['general_summary'] for data in self.models_data.values()], 
-                                           ignore_index=True)
+            self.combined_cultural = combine_models(self.models_data, 'cultural_summary')
+            self.combined_general = combine_models(self.models_data, 'general_summary')
             print(f"📊 Combined dataset: Cultural={len(self.combined_cultural)}, General={len(self.combined_general)}")
-    
-    def _extract_country(self, prompt):
-        """Extract country from prompt"""
-        prompt_lower = prompt.lower()
-        if 'china' in prompt_lower:
-            return 'China'
-        elif 'korea' in prompt_lower:
-            return 'Korea'
-        elif 'india' in prompt_lower:
-            return 'India'
-        elif 'kenya' in prompt_lower:
-            return 'Kenya'
-        elif 'nigeria' in prompt_lower:
-            return 'Nigeria'
-        elif 'united states' in prompt_lower or 'america' in prompt_lower:
-            return 'United_States'
-        return 'Unknown'
-    
-    def _extract_category(self, prompt):
-        """Extract category from prompt"""
-        prompt_lower = prompt.lower()
-        if any(word in prompt_lower for word in ['house', 'landmark', 'building']):
-            return 'architecture'
-        elif any(word in prompt_lower for word in ['dance', 'painting', 'music']):
-            return 'art'
-        elif any(word in prompt_lower for word in ['wedding', 'funeral', 'festival', 'game', 'sport']):
-            return 'event'
-        elif any(word in prompt_lower for word in ['clothing', 'accessories', 'makeup']):
-            return 'fashion'
-        elif any(word in prompt_lower for word in ['food', 'dessert', 'drink']):
-            return 'food'
-        elif any(word in prompt_lower for word in ['animal', 'wildlife']):
-            return 'wildlife'
-        elif any(word in prompt_lower for word in ['landscape', 'nature']):
-            return 'landscape'
-        return 'other'
-    
-    def _extract_variant(self, prompt):
-        """Extract variant from prompt"""
-        prompt_lower = prompt.lower()
-        if 'traditional' in prompt_lower:
-            return 'traditional'
-        elif 'modern' in prompt_lower:
-            return 'modern'
-        elif 'national' in prompt_lower:
-            return 'national'
-        elif 'common' in prompt_lower:
-            return 'common'
-        else:
-            return 'general'
+            
+            # Categorical labels group on integer codes; categories sort like the strings did
+            for combined in (self.combined_cultural, self.combined_general):
+                combined[LABEL_COLUMNS] = combined[LABEL_COLUMNS].astype('category')
+            
+            # Cultural rows with a parsed step, filtered once for every step analysis
+            self._cult_valid = self.combined_cultural[self.combined_cultural['step_num'] >= 0]
+            
+            # Step means, aggregated once over the combined frames and shared by the
+            # step line charts, the step heatmaps and the step report
+            cultural_steps = self._cult_valid
+            self._cult_model_step = cultural_steps.groupby(['model', 'step_num'], observed=True)[CULTURAL_STEP_METRICS].mean()
+            self._cult_country_step = cultural_steps.groupby(['country', 'step_num'], observed=True)[CULTURAL_HEATMAP_METRICS].mean()
+            self._cult_category_step = cultural_steps.groupby(['category', 'step_num'], observed=True)[CULTURAL_HEATMAP_METRICS].mean()
+            self._clip_model_step = self.combined_general.groupby(['model', 'best_clip_step_num'], observed=True)['best_clip_score'].mean()
+            self._aesthetic_model_step = self.combined_general.groupby(['model', 'best_aesthetic_step_num'], observed=True)['best_aesthetic'].mean()
+            
+            models = list(self.models_data)
+            self._cultural_step_means = split_by_model(self._cult_model_step, models)
+            self._clip_step_means = split_by_model(self._clip_model_step, models)
+            self._aesthetic_step_means = split_by_model(self._aesthetic_model_step, models)
     
     def create_step_performance_analysis(self):
         """Create comprehensive step performance analysis"""
@@ -157,53 +197,20 @@ class StepByStepAnalyzer:
         fig, axes = plt.subplots(2, 2, figsize=(20, 16))
         fig.suptitle('Step-by-Step Performance Analysis: Cultural Metrics', fontsize=18, fontweight='bold')
         
-        # F1 Score by Step for each model
-        for model_name, data in self.models_data.items():
-            cultural_data = data['cultural_summary']
-            step_data = cultural_data[cultural_data['step_num'] >= 0].groupby('step_num')['f1'].mean()
-            axes[0, 0].plot(step_data.index, step_data.values, 'o-', label=model_name, linewidth=2, markersize=6)
-        axes[0, 0].set_title('F1 Score by Step', fontsize=14, fontweight='bold')
-        axes[0, 0].set_xlabel('Step Number')
-        axes[0, 0].set_ylabel('F1 Score')
-        axes[0, 0].legend()
-        axes[0, 0].grid(True, alpha=0.3)
-        
-        # Cultural Representative by Step for each model
-        for model_name, data in self.models_data.items():
-            cultural_data = data['cultural_summary']
-            step_data = cultural_data[cultural_data['step_num'] >= 0].groupby('step_num')['cultural_representative'].mean()
-            axes[0, 1].plot(step_data.index, step_data.values, 'o-', label=model_name, linewidth=2, markersize=6)
-        axes[0, 1].set_title('Cultural Representative Score by Step', fontsize=14, fontweight='bold')
-        axes[0, 1].set_xlabel('Step Number')
-        axes[0, 1].set_ylabel('Cultural Representative Score')
-        axes[0, 1].legend()
-        axes[0, 1].grid(True, alpha=0.3)
-        
-        # Accuracy by Step for each model
-        for model_name, data in self.models_data.items():
-            cultural_data = data['cultural_summary']
-            step_data = cultural_data[cultural_data['step_num'] >= 0].groupby('step_num')['accuracy'].mean()
-            axes[1, 0].plot(step_data.index, step_data.values, 'o-', label=model_name, linewidth=2, markersize=6)
-        axes[1, 0].set_title('Accuracy by Step', fontsize=14, fontweight='bold')
-        axes[1, 0].set_xlabel('Step Number')
-        axes[1, 0].set_ylabel('Accuracy')
-        axes[1, 0].legend()
-        axes[1, 0].grid(True, alpha=0.3)
-        
-        # Prompt Alignment by Step for each model
-        for model_name, data in self.models_data.items():
-            cultural_data = data['cultural_summary']
-            step_data = cultural_data[cultural_data['step_num'] >= 0].groupby('step_num')['prompt_alignment'].mean()
-            axes[1, 1].plot(step_data.index, step_data.values, 'o-', label=model_name, linewidth=2, markersize=6)
-        axes[1, 1].set_title('Prompt Alignment by Step', fontsize=14, fontweight='bold')
-        axes[1, 1].set_xlabel('Step Number')
-        axes[1, 1].set_ylabel('Prompt Alignment')
-        axes[1, 1].legend()
-        axes[1, 1].grid(True, alpha=0.3)
+        # One panel per cultural metric, one line per model
+        for ax, (metric, label) in zip(axes.ravel(), CULTURAL_STEP_PANELS):
+            for model_name, step_means in self._cultural_step_means.items():
+                step_data = step_means[metric]
+                ax.plot(step_data.index, step_data.values, 'o-', label=model_name, linewidth=2, markersize=6)
+            ax.set_title(f'{label} by Step', fontsize=14, fontweight='bold')
+            ax.set_xlabel('Step Number')
+            ax.set_ylabel(label)
+            ax.legend()
+            ax.grid(True, alpha=0.3)
         
         plt.tight_layout()
         save_path = os.path.join(self.folders['step_performance'], "cultural_metrics_by_step.png")
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        plt.savefig(save_path, dpi=DPI_DRAFT, **PNG_KW)
         plt.close()
         print(f"  ✅ {save_path}")
         
@@ -211,31 +218,20 @@ class StepByStepAnalyzer:
         fig, axes = plt.subplots(1, 2, figsize=(16, 8))
         fig.suptitle('Step-by-Step Performance Analysis: General Metrics', fontsize=18, fontweight='bold')
         
-        # CLIP Score by Step for each model
-        for model_name, data in self.models_data.items():
-            general_data = data['general_summary']
-            step_data = general_data.groupby('best_clip_step_num')['best_clip_score'].mean()
-            axes[0].plot(step_data.index, step_data.values, 'o-', label=model_name, linewidth=2, markersize=6)
-        axes[0].set_title('CLIP Score by Step', fontsize=14, fontweight='bold')
-        axes[0].set_xlabel('Step Number')
-        axes[0].set_ylabel('CLIP Score')
-        axes[0].legend()
-        axes[0].grid(True, alpha=0.3)
-        
-        # Aesthetic Score by Step for each model
-        for model_name, data in self.models_data.items():
-            general_data = data['general_summary']
-            step_data = general_data.groupby('best_aesthetic_step_num')['best_aesthetic'].mean()
-            axes[1].plot(step_data.index, step_data.values, 'o-', label=model_name, linewidth=2, markersize=6)
-        axes[1].set_title('Aesthetic Score by Step', fontsize=14, fontweight='bold')
-        axes[1].set_xlabel('Step Number')
-        axes[1].set_ylabel('Aesthetic Score')
-        axes[1].legend()
-        axes[1].grid(True, alpha=0.3)
+        # CLIP and Aesthetic Score by Step for each model
+        general_panels = [(self._clip_step_means, 'CLIP Score'), (self._aesthetic_step_means, 'Aesthetic Score')]
+        for ax, (step_means, label) in zip(axes, general_panels):
+            for model_name, step_data in step_means.items():
+                ax.plot(step_data.index, step_data.values, 'o-', label=model_name, linewidth=2, markersize=6)
+            ax.set_title(f'{label} by Step', fontsize=14, fontweight='bold')
+            ax.set_xlabel('Step Number')
+            ax.set_ylabel(label)
+            ax.legend()
+            ax.grid(True, alpha=0.3)
         
         plt.tight_layout()
         save_path = os.path.join(self.folders['step_performance'], "general_metrics_by_step.png")
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        plt.savefig(save_path, dpi=DPI_DRAFT, **PNG_KW)
         plt.close()
         print(f"  ✅ {save_path}")
     
@@ -248,12 +244,7 @@ class StepByStepAnalyzer:
         fig.suptitle('Model Performance by Step: Comprehensive Comparison', fontsize=18, fontweight='bold')
         
         # F1 Score Heatmap
-        f1_pivot = self.combined_cultural[self.combined_cultural['step_num'] >= 0].pivot_table(
-            values='f1', 
-            index='model', 
-            columns='step_num', 
-            aggfunc='mean'
-        )
+        f1_pivot = self._cult_model_step['f1'].unstack('step_num')
         sns.heatmap(f1_pivot, annot=True, fmt='.3f', cmap='Blues', 
                    ax=axes[0, 0], cbar_kws={'label': 'F1 Score'})
         axes[0, 0].set_title('F1 Score by Model & Step', fontsize=14, fontweight='bold')
@@ -261,12 +252,7 @@ class StepByStepAnalyzer:
         axes[0, 0].set_ylabel('Model')
         
         # Cultural Representative Heatmap
-        cultural_rep_pivot = self.combined_cultural[self.combined_cultural['step_num'] >= 0].pivot_table(
-            values='cultural_representative', 
-            index='model', 
-            columns='step_num', 
-            aggfunc='mean'
-        )
+        cultural_rep_pivot = self._cult_model_step['cultural_representative'].unstack('step_num')
         sns.heatmap(cultural_rep_pivot, annot=True, fmt='.2f', cmap='RdYlGn', 
                    ax=axes[0, 1], cbar_kws={'label': 'Cultural Rep Score'})
         axes[0, 1].set_title('Cultural Representative by Model & Step', fontsize=14, fontweight='bold')
@@ -274,12 +260,7 @@ class StepByStepAnalyzer:
         axes[0, 1].set_ylabel('Model')
         
         # CLIP Score Heatmap
-        clip_pivot = self.combined_general.pivot_table(
-            values='best_clip_score', 
-            index='model', 
-            columns='best_clip_step_num', 
-            aggfunc='mean'
-        )
+        clip_pivot = self._clip_model_step.unstack('best_clip_step_num')
         sns.heatmap(clip_pivot, annot=True, fmt='.1f', cmap='Purples', 
                    ax=axes[1, 0], cbar_kws={'label': 'CLIP Score'})
         axes[1, 0].set_title('CLIP Score by Model & Step', fontsize=14, fontweight='bold')
@@ -287,12 +268,7 @@ class StepByStepAnalyzer:
         axes[1, 0].set_ylabel('Model')
         
         # Aesthetic Score Heatmap
-        aesthetic_pivot = self.combined_general.pivot_table(
-            values='best_aesthetic', 
-            index='model', 
-            columns='best_aesthetic_step_num', 
-            aggfunc='mean'
-        )
+        aesthetic_pivot = self._aesthetic_model_step.unstack('best_aesthetic_step_num')
         sns.heatmap(aesthetic_pivot, annot=True, fmt='.2f', cmap='Oranges', 
                    ax=axes[1, 1], cbar_kws={'label': 'Aesthetic Score'})
         axes[1, 1].set_title('Aesthetic Score by Model & Step', fontsize=14, fontweight='bold')
@@ -301,7 +277,7 @@ class StepByStepAnalyzer:
         
         plt.tight_layout()
         save_path = os.path.join(self.folders['step_comparison'], "model_step_comparison.png")
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        plt.savefig(save_path, dpi=DPI_DRAFT, **PNG_KW)
         plt.close()
         print(f"  ✅ {save_path}")
     
@@ -313,10 +289,10 @@ class StepByStepAnalyzer:
         fig, axes = plt.subplots(2, 2, figsize=(20, 16))
         fig.suptitle('Optimal Steps Analysis: Best Performance by Model & Country', fontsize=18, fontweight='bold')
         
+        cultural_steps = self._cult_valid
+        
         # Best F1 Step by Model & Country
-        best_f1_steps = self.combined_cultural[self.combined_cultural['step_num'] >= 0].groupby(['model', 'country'])['f1'].idxmax()
-        best_f1_data = self.combined_cultural.loc[best_f1_steps, ['model', 'country', 'step_num', 'f1']]
-        best_f1_pivot = best_f1_data.pivot_table(values='step_num', index='country', columns='model', aggfunc='mean')
+        best_f1_pivot = best_step_by_country(cultural_steps, 'f1', 'step_num')
         
         sns.heatmap(best_f1_pivot, annot=True, fmt='.0f', cmap='Blues', 
                    ax=axes[0, 0], cbar_kws={'label': 'Best F1 Step'})
@@ -325,9 +301,7 @@ class StepByStepAnalyzer:
         axes[0, 0].set_ylabel('Country')
         
         # Best Cultural Rep Step by Model & Country
-        best_cultural_rep_steps = self.combined_cultural[self.combined_cultural['step_num'] >= 0].groupby(['model', 'country'])['cultural_representative'].idxmax()
-        best_cultural_rep_data = self.combined_cultural.loc[best_cultural_rep_steps, ['model', 'country', 'step_num', 'cultural_representative']]
-        best_cultural_rep_pivot = best_cultural_rep_data.pivot_table(values='step_num', index='country', columns='model', aggfunc='mean')
+        best_cultural_rep_pivot = best_step_by_country(cultural_steps, 'cultural_representative', 'step_num')
         
         sns.heatmap(best_cultural_rep_pivot, annot=True, fmt='.0f', cmap='RdYlGn', 
                    ax=axes[0, 1], cbar_kws={'label': 'Best Cultural Rep Step'})
@@ -336,9 +310,7 @@ class StepByStepAnalyzer:
         axes[0, 1].set_ylabel('Country')
         
         # Best CLIP Step by Model & Country
-        best_clip_steps = self.combined_general.groupby(['model', 'country'])['best_clip_score'].idxmax()
-        best_clip_data = self.combined_general.loc[best_clip_steps, ['model', 'country', 'best_clip_step_num', 'best_clip_score']]
-        best_clip_pivot = best_clip_data.pivot_table(values='best_clip_step_num', index='country', columns='model', aggfunc='mean')
+        best_clip_pivot = best_step_by_country(self.combined_general, 'best_clip_score', 'best_clip_step_num')
         
         sns.heatmap(best_clip_pivot, annot=True, fmt='.0f', cmap='Purples', 
                    ax=axes[1, 0], cbar_kws={'label': 'Best CLIP Step'})
@@ -347,9 +319,7 @@ class StepByStepAnalyzer:
         axes[1, 0].set_ylabel('Country')
         
         # Best Aesthetic Step by Model & Country
-        best_aesthetic_steps = self.combined_general.groupby(['model', 'country'])['best_aesthetic'].idxmax()
-        best_aesthetic_data = self.combined_general.loc[best_aesthetic_steps, ['model', 'country', 'best_aesthetic_step_num', 'best_aesthetic']]
-        best_aesthetic_pivot = best_aesthetic_data.pivot_table(values='best_aesthetic_step_num', index='country', columns='model', aggfunc='mean')
+        best_aesthetic_pivot = best_step_by_country(self.combined_general, 'best_aesthetic', 'best_aesthetic_step_num')
         
         sns.heatmap(best_aesthetic_pivot, annot=True, fmt='.0f', cmap='Oranges', 
                    ax=axes[1, 1], cbar_kws={'label': 'Best Aesthetic Step'})
@@ -359,7 +329,7 @@ class StepByStepAnalyzer:
         
         plt.tight_layout()
         save_path = os.path.join(self.folders['optimal_steps'], "optimal_steps_analysis.png")
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        plt.savefig(save_path, dpi=DPI_DRAFT, **PNG_KW)
         plt.close()
         print(f"  ✅ {save_path}")
     
@@ -372,12 +342,7 @@ class StepByStepAnalyzer:
         fig.suptitle('Step Performance by Country and Category: Detailed Analysis', fontsize=20, fontweight='bold')
         
         # F1 Score by Country & Step
-        f1_country_step = self.combined_cultural[self.combined_cultural['step_num'] >= 0].pivot_table(
-            values='f1', 
-            index='country', 
-            columns='step_num', 
-            aggfunc='mean'
-        )
+        f1_country_step = self._cult_country_step['f1'].unstack('step_num')
         sns.heatmap(f1_country_step, annot=True, fmt='.3f', cmap='Blues', 
                    ax=axes[0, 0], cbar_kws={'label': 'F1 Score'})
         axes[0, 0].set_title('F1 Score by Country & Step', fontsize=14, fontweight='bold')
@@ -385,12 +350,7 @@ class StepByStepAnalyzer:
         axes[0, 0].set_ylabel('Country')
         
         # Cultural Rep by Country & Step
-        cultural_rep_country_step = self.combined_cultural[self.combined_cultural['step_num'] >= 0].pivot_table(
-            values='cultural_representative', 
-            index='country', 
-            columns='step_num', 
-            aggfunc='mean'
-        )
+        cultural_rep_country_step = self._cult_country_step['cultural_representative'].unstack('step_num')
         sns.heatmap(cultural_rep_country_step, annot=True, fmt='.2f', cmap='RdYlGn', 
                    ax=axes[0, 1], cbar_kws={'label': 'Cultural Rep Score'})
         axes[0, 1].set_title('Cultural Rep by Country & Step', fontsize=14, fontweight='bold')
@@ -398,12 +358,7 @@ class StepByStepAnalyzer:
         axes[0, 1].set_ylabel('Country')
         
         # F1 Score by Category & Step
-        f1_category_step = self.combined_cultural[self.combined_cultural['step_num'] >= 0].pivot_table(
-            values='f1', 
-            index='category', 
-            columns='step_num', 
-            aggfunc='mean'
-        )
+        f1_category_step = self._cult_category_step['f1'].unstack('step_num')
         sns.heatmap(f1_category_step, annot=True, fmt='.3f', cmap='Greens', 
                    ax=axes[1, 0], cbar_kws={'label': 'F1 Score'})
         axes[1, 0].set_title('F1 Score by Category & Step', fontsize=14, fontweight='bold')
@@ -411,12 +366,7 @@ class StepByStepAnalyzer:
         axes[1, 0].set_ylabel('Category')
         
         # Cultural Rep by Category & Step
-        cultural_rep_category_step = self.combined_cultural[self.combined_cultural['step_num'] >= 0].pivot_table(
-            values='cultural_representative', 
-            index='category', 
-            columns='step_num', 
-            aggfunc='mean'
-        )
+        cultural_rep_category_step = self._cult_category_step['cultural_representative'].unstack('step_num')
         sns.heatmap(cultural_rep_category_step, annot=True, fmt='.2f', cmap='Oranges', 
                    ax=axes[1, 1], cbar_kws={'label': 'Cultural Rep Score'})
         axes[1, 1].set_title('Cultural Rep by Category & Step', fontsize=14, fontweight='bold')
@@ -425,7 +375,7 @@ class StepByStepAnalyzer:
         
         plt.tight_layout()
         save_path = os.path.join(self.folders['step_heatmaps'], "detailed_step_heatmaps.png")
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        plt.savefig(save_path, dpi=DPI_DRAFT, **PNG_KW)
         plt.close()
         print(f"  ✅ {save_path}")
     
@@ -433,44 +383,26 @@ class StepByStepAnalyzer:
         """Create step insights and summary"""
         print(f"\n💡 Generating Step Insights...")
         
-        # 1. Step Performance Summary
-        step_summary = []
-        
-        for model_name, data in self.models_data.items():
-            cultural_data = data['cultural_summary']
-            general_data = data['general_summary']
-            
-            # Find best steps for each metric
-            cultural_steps = cultural_data[cultural_data['step_num'] >= 0]
-            if not cultural_steps.empty:
-                best_f1_step = cultural_steps.loc[cultural_steps['f1'].idxmax(), 'step_num']
-                best_cultural_rep_step = cultural_steps.loc[cultural_steps['cultural_representative'].idxmax(), 'step_num']
-                best_f1_score = cultural_steps['f1'].max()
-                best_cultural_rep_score = cultural_steps['cultural_representative'].max()
-            else:
-                best_f1_step = best_cultural_rep_step = 0
-                best_f1_score = best_cultural_rep_score = 0
-            
-            # General metrics
-            best_clip_step = general_data.loc[general_data['best_clip_score'].idxmax(), 'best_clip_step_num']
-            best_aesthetic_step = general_data.loc[general_data['best_aesthetic'].idxmax(), 'best_aesthetic_step_num']
-            best_clip_score = general_data['best_clip_score'].max()
-            best_aesthetic_score = general_data['best_aesthetic'].max()
-            
-            step_summary.append({
-                'Model': model_name.upper(),
-                'Best F1 Step': int(best_f1_step),
-                'Best F1 Score': f'{best_f1_score:.3f}',
-                'Best Cultural Rep Step': int(best_cultural_rep_step),
-                'Best Cultural Rep Score': f'{best_cultural_rep_score:.2f}',
-                'Best CLIP Step': int(best_clip_step),
-                'Best CLIP Score': f'{best_clip_score:.1f}',
-                'Best Aesthetic Step': int(best_aesthetic_step),
-                'Best Aesthetic Score': f'{best_aesthetic_score:.2f}'
-            })
+        # 1. Step Performance Summary: the step with the best mean per model, read off the
+        # shared (model, step) aggregates
+        models = list(self.models_data)
+        f1_steps, f1_scores = best_step_per_model(self._cult_model_step['f1'], models)
+        cultural_rep_steps, cultural_rep_scores = best_step_per_model(self._cult_model_step['cultural_representative'], models)
+        clip_steps, clip_scores = best_step_per_model(self._clip_model_step, models)
+        aesthetic_steps, aesthetic_scores = best_step_per_model(self._aesthetic_model_step, models)
         
         # Create step summary table
-        step_summary_df = pd.DataFrame(step_summary)
+        step_summary_df = pd.DataFrame({
+            'Model': [model_name.upper() for model_name in models],
+            'Best F1 Step': f1_steps,
+            'Best F1 Score': [f'{score:.3f}' for score in f1_scores],
+            'Best Cultural Rep Step': cultural_rep_steps,
+            'Best Cultural Rep Score': [f'{score:.2f}' for score in cultural_rep_scores],
+            'Best CLIP Step': clip_steps,
+            'Best CLIP Score': [f'{score:.1f}' for score in clip_scores],
+            'Best Aesthetic Step': aesthetic_steps,
+            'Best Aesthetic Score': [f'{score:.2f}' for score in aesthetic_scores]
+        })
         
         # Save as CSV
         csv_path = os.path.join(self.folders['step_insights'], "step_performance_summary.csv")
@@ -519,7 +451,7 @@ class StepByStepAnalyzer:
         
         plt.title('Optimal Steps Summary: Best Performance by Model', fontsize=16, fontweight='bold', pad=20)
         save_path = os.path.join(self.folders['step_insights'], "optimal_steps_summary.png")
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        plt.savefig(save_path, dpi=DPI_FINAL, **PNG_KW)
         plt.close()
         print(f"  ✅ {save_path}")
     
@@ -546,15 +478,12 @@ class StepByStepAnalyzer:
         # Calculate step performance for each model
         step_analysis = {}
         
-        for model_name, data in self.models_data.items():
-            cultural_data = data['cultural_summary']
-            general_data = data['general_summary']
-            
+        for model_name in self.models_data:
             # Cultural metrics by step
-            cultural_steps = cultural_data[cultural_data['step_num'] >= 0]
-            if not cultural_steps.empty:
-                step_f1 = cultural_steps.groupby('step_num')['f1'].mean()
-                step_cultural_rep = cultural_steps.groupby('step_num')['cultural_representative'].mean()
+            cultural_step_means = self._cultural_step_means[model_name]
+            if not cultural_step_means.empty:
+                step_f1 = cultural_step_means['f1']
+                step_cultural_rep = cultural_step_means['cultural_representative']
                 
                 # Find optimal steps
                 optimal_f1_step = step_f1.idxmax()
@@ -566,8 +495,8 @@ class StepByStepAnalyzer:
                 max_f1 = max_cultural_rep = 0
             
             # General metrics
-            step_clip = general_data.groupby('best_clip_step_num')['best_clip_score'].mean()
-            step_aesthetic = general_data.groupby('best_aesthetic_step_num')['best_aesthetic'].mean()
+            step_clip = self._clip_step_means[model_name]
+            step_aesthetic = self._aesthetic_step_means[model_name]
             
             optimal_clip_step = step_clip.idxmax()
             optimal_aesthetic_step = step_aesthetic.idxmax()